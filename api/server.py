@@ -1,19 +1,25 @@
 """REST API server for Claude integration and external access"""
 
 import asyncio
+import msgspec
 import uvicorn
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import os
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from execution import MarketScanner, OutputFormatter
+from execution import MarketScanner
 from tracking import PerformanceTracker
-from utils import ScanResult, logger
+from utils import ScanResult, logger, setup_logging
 from config import config
 
 # Pydantic models for API requests/responses
@@ -23,9 +29,10 @@ class ScanRequest(BaseModel):
     min_score: Optional[int] = Field(None, description="Minimum score threshold")
     max_results: Optional[int] = Field(3, description="Maximum results to return")
 
-class ScanResponse(BaseModel):
+# Response payloads are msgspec structs - encoded without a validation pass
+class ScanResponse(msgspec.Struct):
     scan_id: str
-    timestamp: datetime
+    timestamp: str
     btc_benchmark: float
     total_symbols_analyzed: int
     candidates: List[Dict[str, Any]]
@@ -64,30 +71,124 @@ async def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(sec
     
     return credentials.credentials
 
+class ResponseCache:
+    """Short-TTL async cache for upstream-backed endpoints.
+    
+    Concurrent misses on the same key share one fetch, and if a refresh
+    fails the last cached value is served instead (stale-on-error).
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}  # key -> (expiry, value)
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def get(self, key: str, ttl: float, fetch):
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed the entry while we waited
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            
+            try:
+                value = await fetch()
+            except Exception as e:
+                if entry:
+                    logger.warning(f"Refresh of {key} failed, serving cached value: {e}")
+                    return entry[1]
+                raise
+            
+            self._entries[key] = (time.monotonic() + ttl, value)
+            return value
+
+def now_iso(_cache: Dict[int, str] = {}) -> str:
+    """UTC ISO timestamp, formatted at most once per second"""
+    t = int(time.time())
+    s = _cache.get(t)
+    if not s:
+        s = datetime.fromtimestamp(t, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _cache.clear()
+        _cache[t] = s
+    return s
+
+# Shared components - built once per process, not per create_app() call
+@lru_cache(maxsize=1)
+def get_scanner() -> MarketScanner:
+    return MarketScanner()
+
+@lru_cache(maxsize=1)
+def get_tracker() -> Optional[PerformanceTracker]:
+    return PerformanceTracker() if config.TRACK_PERFORMANCE else None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm shared components and the OpenAPI schema before serving requests"""
+    scanner = get_scanner()
+    tracker = get_tracker()
+    app.openapi()
+    
+    # Component validation runs on a heartbeat; /health only reads the result
+    app.state.health = {}
+    heartbeat_task = asyncio.create_task(health_heartbeat(app, scanner))
+    
+    # Tracker writes are queued and drained off the request path
+    app.state.log_q = asyncio.Queue()
+    drain_task = asyncio.create_task(drain_scan_log(app.state.log_q, tracker)) if tracker else None
+    
+    yield
+    
+    heartbeat_task.cancel()
+    if drain_task:
+        try:
+            await asyncio.wait_for(app.state.log_q.join(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("Shutting down with unwritten scan logs")
+        drain_task.cancel()
+    
+    scanner.close()
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     
+    # uvicorn workers import this factory in fresh processes
+    setup_logging(config.LOG_LEVEL, config.LOG_FILE)
+    
     app = FastAPI(
         title="Market Scanner API",
         description="Autonomous Market Scanner - Find symbols guaranteed to outperform BTC",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
-    # CORS middleware for web frontends
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Compress large payloads (/scan, /performance)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    
+    # CORS middleware for web frontends - origins from $CORS_ORIGINS (comma-separated)
+    origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()]
+    if origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=origins,
+            allow_credentials=True,
+            allow_methods=["GET", "POST"],
+            allow_headers=["Authorization", "Content-Type"],
+        )
     
-    # Global instances
-    scanner = MarketScanner()
-    formatter = OutputFormatter()
-    tracker = PerformanceTracker() if config.TRACK_PERFORMANCE else None
+    cache = ResponseCache()
+    
+    async def cached_btc_return(timeframe: str, ttl: float = 10) -> float:
+        scanner = get_scanner()
+        return await cache.get(
+            f"btc_return:{timeframe}", ttl,
+            lambda: scanner.composer_scorer.btc_benchmark.get_expected_return(timeframe)
+        )
     
     @app.get("/", tags=["Health"])
     async def root():
@@ -96,97 +197,76 @@ def create_app() -> FastAPI:
             "service": "Market Scanner API",
             "status": "operational",
             "version": "1.0.0",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     @app.get("/health", tags=["Health"])
     async def health_check():
         """Detailed health check with component validation"""
-        validation = await scanner.validate_setup()
+        validation = app.state.health
+        
+        if not validation:
+            status = "starting"
+        else:
+            status = "healthy" if all(validation.values()) else "degraded"
         
         return {
-            "status": "healthy" if all(validation.values()) else "degraded",
+            "status": status,
             "components": validation,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
-    @app.post("/scan", response_model=ScanResponse, tags=["Analysis"])
+    @app.post("/scan", tags=["Analysis"])
     async def run_scan(
         request: ScanRequest,
-        background_tasks: BackgroundTasks,
-        api_key: Optional[str] = Depends(verify_api_key)
+        api_key: Optional[str] = Depends(verify_api_key),
+        scanner: MarketScanner = Depends(get_scanner),
+        tracker: Optional[PerformanceTracker] = Depends(get_tracker)
     ):
         """🎯 Run a complete market scan - main endpoint for Claude"""
         try:
-            # Override config if specified
-            if request.min_score:
-                original_threshold = config.MIN_SCORE_THRESHOLD
-                config.MIN_SCORE_THRESHOLD = request.min_score
-            
-            # Run the scan
+            # Run the scan - min_score is request-local, config is never mutated
             results = await scanner.run_scan(
                 timeframe=request.timeframe,
-                custom_symbols=request.symbols
+                custom_symbols=request.symbols,
+                min_score=request.min_score
             )
             
-            # Restore original config
-            if request.min_score:
-                config.MIN_SCORE_THRESHOLD = original_threshold
-            
             # Limit results
             if request.max_results:
                 results = results[:request.max_results]
             
             # Get BTC benchmark
-            btc_return = await scanner.composer_scorer.btc_benchmark.get_expected_return(request.timeframe)
+            btc_return = await cached_btc_return(request.timeframe)
             
-            # Convert results to API format
-            candidates = []
-            for result in results:
-                candidate = {
-                    "rank": result.rank,
-                    "symbol": result.symbol,
-                    "score": round(result.score, 1),
-                    "current_price": round(result.current_price, 2),
-                    "vwap": round(result.vwap, 2),
-                    "target_strike": round(result.target_strike, 2) if result.target_strike else None,
-                    "probability_reach": round(result.probability_reach, 3),
-                    "expected_return": round(result.expected_return, 3),
-                    "timeframe": result.timeframe,
-                    "entry_zone": {
-                        "low": round(result.entry_zone[0], 2),
-                        "high": round(result.entry_zone[1], 2)
-                    },
-                    "stop_loss": round(result.stop_loss, 2),
-                    "squeeze_factors": result.squeeze_factors,
-                    "reasoning": result.reasoning
-                }
-                candidates.append(candidate)
+            # Pre-rounded API view cached on each result
+            candidates = [result.api_dict for result in results]
             
             # Generate scan ID
-            scan_id = f"scan_{int(datetime.now().timestamp())}"
+            scan_id = f"scan_{int(time.time())}"
             
-            # Background task: log to tracker
+            # Queue tracker write - drained by the lifespan worker
             if tracker:
-                background_tasks.add_task(
-                    log_scan_to_tracker,
-                    tracker, results, len(request.symbols) if request.symbols else 50,
+                app.state.log_q.put_nowait((
+                    results, len(request.symbols) if request.symbols else 50,
                     btc_return, request.timeframe
-                )
+                ))
             
-            return ScanResponse(
+            response = ScanResponse(
                 scan_id=scan_id,
-                timestamp=datetime.now(),
+                timestamp=now_iso(),
                 btc_benchmark=btc_return,
-                total_symbols_analyzed=len(request.symbols) if request.symbols else len(scanner.data_manager.universe.get_active_symbols()),
+                total_symbols_analyzed=len(request.symbols) if request.symbols else scanner.universe_size,
                 candidates=candidates,
                 metadata={
                     "timeframe": request.timeframe,
-                    "min_score_used": request.min_score or config.MIN_SCORE_THRESHOLD,
+                    "min_score_used": config.MIN_SCORE_THRESHOLD if request.min_score is None else request.min_score,
                     "api_version": "1.0.0"
                 }
             )
             
+            return Response(content=msgspec.json.encode(response), media_type="application/json")
+            
         except Exception as e:
             logger.error(f"Error in scan endpoint: {e}")
             raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
@@ -194,11 +274,13 @@ def create_app() -> FastAPI:
     @app.post("/quick-analysis", tags=["Analysis"])
     async def quick_analysis(
         request: QuickAnalysisRequest,
-        api_key: Optional[str] = Depends(verify_api_key)
+        max_concurrency: int = Query(min(16, config.MAX_CONCURRENT_REQUESTS), ge=1, le=config.MAX_CONCURRENT_REQUESTS),
+        api_key: Optional[str] = Depends(verify_api_key),
+        scanner: MarketScanner = Depends(get_scanner)
     ):
         """⚡ Quick analysis of specific symbols"""
         try:
-            results = await scanner.quick_scan(request.symbols)
+            results = await scanner.quick_scan(request.symbols, max_concurrency=max_concurrency)
             
             if not results:
                 return {
@@ -209,21 +291,22 @@ def create_app() -> FastAPI:
             
             candidates = []
             for result in results:
+                row = result.api_dict
                 candidates.append({
-                    "rank": result.rank,
-                    "symbol": result.symbol,
-                    "score": round(result.score, 1),
-                    "current_price": round(result.current_price, 2),
-                    "expected_return": round(result.expected_return, 3),
-                    "probability": round(result.probability_reach, 3),
-                    "timeframe": result.timeframe,
-                    "reasoning": result.reasoning
+                    "rank": row["rank"],
+                    "symbol": row["symbol"],
+                    "score": row["score"],
+                    "current_price": row["current_price"],
+                    "expected_return": row["expected_return"],
+                    "probability": row["probability_reach"],
+                    "timeframe": row["timeframe"],
+                    "reasoning": row["reasoning"]
                 })
             
             return {
                 "symbols_analyzed": request.symbols,
                 "candidates": candidates,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
@@ -233,7 +316,8 @@ def create_app() -> FastAPI:
     @app.get("/performance", tags=["Analytics"])
     async def get_performance(
         days: int = 30,
-        api_key: Optional[str] = Depends(verify_api_key)
+        api_key: Optional[str] = Depends(verify_api_key),
+        tracker: Optional[PerformanceTracker] = Depends(get_tracker)
     ):
         """📊 Get performance statistics"""
         if not tracker:
@@ -249,7 +333,7 @@ def create_app() -> FastAPI:
                 "overall_performance": stats,
                 "signal_effectiveness": effectiveness,
                 "recent_scans": recent_scans,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
@@ -259,7 +343,8 @@ def create_app() -> FastAPI:
     @app.post("/universe", tags=["Configuration"])
     async def manage_universe(
         request: UniverseRequest,
-        api_key: Optional[str] = Depends(verify_api_key)
+        api_key: Optional[str] = Depends(verify_api_key),
+        scanner: MarketScanner = Depends(get_scanner)
     ):
         """🌌 Manage symbol universe"""
         try:
@@ -274,21 +359,25 @@ def create_app() -> FastAPI:
                 }
             
             elif request.action == "add" and request.symbols:
-                for symbol in request.symbols:
-                    universe_manager.add_symbol(symbol.upper())
+                symbols = list(dict.fromkeys(s.upper() for s in request.symbols))
+                for symbol in symbols:
+                    universe_manager.add_symbol(symbol)
+                scanner.invalidate_symbols()
                 return {
                     "action": "add",
-                    "symbols_added": [s.upper() for s in request.symbols],
-                    "message": f"Added {len(request.symbols)} symbols to universe"
+                    "symbols_added": symbols,
+                    "message": f"Added {len(symbols)} symbols to universe"
                 }
             
             elif request.action == "remove" and request.symbols:
-                for symbol in request.symbols:
-                    universe_manager.remove_symbol(symbol.upper())
+                symbols = list(dict.fromkeys(s.upper() for s in request.symbols))
+                for symbol in symbols:
+                    universe_manager.remove_symbol(symbol)
+                scanner.invalidate_symbols()
                 return {
                     "action": "remove", 
-                    "symbols_removed": [s.upper() for s in request.symbols],
-                    "message": f"Removed {len(request.symbols)} symbols from universe"
+                    "symbols_removed": symbols,
+                    "message": f"Removed {len(symbols)} symbols from universe"
                 }
             
             else:
@@ -305,13 +394,13 @@ def create_app() -> FastAPI:
     ):
         """📈 Get current Bitcoin benchmark for comparison"""
         try:
-            btc_return = await scanner.composer_scorer.btc_benchmark.get_expected_return(timeframe)
+            btc_return = await cached_btc_return(timeframe)
             
             return {
                 "timeframe": timeframe,
                 "btc_expected_return": btc_return,
                 "btc_expected_return_pct": f"{btc_return:.2%}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
@@ -321,7 +410,8 @@ def create_app() -> FastAPI:
     @app.get("/market-data/{symbol}", tags=["Data"])
     async def get_market_data(
         symbol: str,
-        api_key: Optional[str] = Depends(verify_api_key)
+        api_key: Optional[str] = Depends(verify_api_key),
+        scanner: MarketScanner = Depends(get_scanner)
     ):
         """📊 Get current market data for a symbol"""
         try:
@@ -359,21 +449,47 @@ def create_app() -> FastAPI:
             "status": "paper_trade_simulated",
             "message": "Execution capabilities coming soon - integrate with Alpaca/IBKR/Schwab",
             "request": request.dict(),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     return app
 
-async def log_scan_to_tracker(tracker, results, total_symbols, btc_return, timeframe):
-    """Background task to log scan results"""
-    try:
-        tracker.log_scan(results, total_symbols, btc_return, timeframe)
-    except Exception as e:
-        logger.error(f"Error logging scan to tracker: {e}")
+async def health_heartbeat(app: FastAPI, scanner: MarketScanner, interval: float = 20):
+    """Refresh app.state.health from scanner.validate_setup() every interval seconds"""
+    while True:
+        try:
+            app.state.health = await scanner.validate_setup()
+        except Exception as e:
+            logger.error(f"Health validation failed: {e}")
+        await asyncio.sleep(interval)
 
-def run_server(host: str = "127.0.0.1", port: int = 8888, reload: bool = False):
-    """Run the API server"""
-    app = create_app()
+async def drain_scan_log(queue: asyncio.Queue, tracker: PerformanceTracker):
+    """Write queued scans to the tracker in a worker thread"""
+    loop = asyncio.get_running_loop()
+    while True:
+        results, total_symbols, btc_return, timeframe = await queue.get()
+        try:
+            await loop.run_in_executor(None, tracker.log_scan, results, total_symbols, btc_return, timeframe)
+        except Exception as e:
+            logger.error(f"Error logging scan to tracker: {e}")
+        finally:
+            queue.task_done()
+
+def run_server(host: str = "127.0.0.1", port: int = 8888, reload: bool = False,
+               workers: Optional[int] = None):
+    """Run the API server
+    
+    Worker count defaults to $WEB_CONCURRENCY (or 1). reload=True forces a
+    single worker. Each worker is a separate process with its own scanner and
+    caches - use an out-of-process cache (e.g. Redis) for state that must be
+    shared between workers. The symbol universe is deliberately per-worker:
+    uvicorn spawns (not forks) its workers and /universe mutates the list, so
+    a read-only shared-memory copy would go stale.
+    """
+    if workers is None:
+        workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if reload:
+        workers = 1
     
     print(f"🚀 Starting Market Scanner API on http://{host}:{port}")
     print(f"📖 API Documentation: http://{host}:{port}/docs")
@@ -385,6 +501,9 @@ def run_server(host: str = "127.0.0.1", port: int = 8888, reload: bool = False):
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop="auto",  # uvloop / httptools when installed, asyncio / h11 otherwise
+        http="auto",
         log_level="info"
     )
 
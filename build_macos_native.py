@@ -2,39 +2,60 @@
 import os
 import subprocess
 import shutil
+import sys
+import zipapp
 
-# This will create a Python script bundle that can run on macOS
+ENTRY_POINT = "simple_scanner.py"
+BUNDLE_NAME = "market-scanner-macos.pyz"
+
+def build_frozen_binary():
+    """Freeze the scanner into a real ARM64 executable with PyInstaller.
+    
+    The result carries its own interpreter and pre-compiled bytecode, so a
+    launch is a single process start instead of shim -> shell -> python3.
+    """
+    print("Building frozen macOS ARM64 binary...")
+    
+    result = subprocess.run([
+        sys.executable, "-m", "PyInstaller",
+        "--onefile",
+        "--target-arch", "arm64",
+        "--name", "market-scanner-macos-arm64",
+        ENTRY_POINT
+    ])
+    
+    if result.returncode != 0:
+        print("❌ PyInstaller build failed")
+        return False
+    
+    print("✅ macOS ARM64 binary created: dist/market-scanner-macos-arm64")
+    return True
+
+# This will create a Python zipapp bundle that can run on macOS
 def create_macos_bundle():
     print("Creating macOS ARM64 Python bundle...")
     
-    # Create a standalone Python script with dependencies
-    with open("market-scanner-macos", "w") as f:
-        f.write("#!/usr/bin/env python3\n")
-        f.write("# Market Scanner for macOS ARM64\n\n")
-        
-        # Include all dependencies inline
-        modules = ["simple_scanner.py", "signal_engines.py", "data_feeds.py", 
-                  "composite_scoring.py", "orchestrator.py"]
-        
-        for module in modules:
-            if os.path.exists(module):
-                with open(module) as m:
-                    content = m.read()
-                    # Remove the shebang and imports we will handle
-                    lines = content.split("\n")
-                    filtered = []
-                    for line in lines:
-                        if not line.startswith("#!/") and not line.startswith("from ."):
-                            filtered.append(line)
-                    f.write("\n".join(filtered) + "\n\n")
-        
-        # Add main execution
-        f.write("\nif __name__ == \"__main__\":\n")
-        f.write("    scanner = SimpleScanner()\n")
-        f.write("    scanner.run()\n")
+    # Stage the modules unchanged and let zipapp (PEP 441) package them -
+    # imports resolve through zipimport, no source rewriting needed
+    staging_dir = os.path.join("build", "pyz_src")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+    
+    modules = ["simple_scanner.py", "signal_engines.py", "data_feeds.py", 
+              "composite_scoring.py", "orchestrator.py"]
     
-    # Make executable
-    os.chmod("market-scanner-macos", 0o755)
+    for module in modules:
+        if os.path.exists(module):
+            shutil.copy2(module, staging_dir)
+    
+    # Archive gets a shebang and the executable bit
+    zipapp.create_archive(
+        staging_dir,
+        target=BUNDLE_NAME,
+        interpreter="/usr/bin/env python3",
+        main="simple_scanner:cli",
+        compressed=True
+    )
     
     # Create ARM64 binary wrapper using osxcross
     print("Creating native ARM64 wrapper...")
@@ -43,11 +64,21 @@ def create_macos_bundle():
     
     wrapper_code = """
 #include <stdio.h>
-#include <stdlib.h>
 #include <unistd.h>
 
 int main(int argc, char *argv[]) {
-    return system("/usr/bin/python3 market-scanner-macos");
+    /* Replace this process with python3 - no intermediate /bin/sh */
+    char *args[argc + 2];
+    args[0] = "python3";
+    args[1] = "market-scanner-macos.pyz";
+    for (int i = 1; i < argc; i++) {
+        args[i + 1] = argv[i];
+    }
+    args[argc + 1] = NULL;
+
+    execv("/usr/bin/python3", args);
+    perror("execv");
+    return 127;
 }
 """
     
@@ -66,4 +97,8 @@ int main(int argc, char *argv[]) {
     print("✅ macOS ARM64 binary created: market-scanner-macos-arm64")
 
 if __name__ == "__main__":
-    create_macos_bundle()
+    # --script builds the interpreter-dependent bundle for hosts without PyInstaller
+    if "--script" in sys.argv:
+        create_macos_bundle()
+    elif not build_frozen_binary():
+        sys.exit(1)
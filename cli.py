@@ -5,6 +5,7 @@ Market Scanner CLI - One-button autonomous market scanning
 
 import asyncio
 import click
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -12,10 +13,10 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from execution import MarketScanner, OutputFormatter
-from tracking import PerformanceTracker
 from config import config
-from utils import logger, setup_logging
+
+# Scanner, tracker and utils (pandas/numpy) are imported inside the commands
+# that need them so --help and version stay fast
 
 console = Console()
 
@@ -27,9 +28,11 @@ def cli(ctx, debug, config_file):
     """🚀 Autonomous Market Scanner - Find symbols guaranteed to outperform BTC"""
     ctx.ensure_object(dict)
     
-    # Setup logging
-    log_level = "DEBUG" if debug else config.LOG_LEVEL
-    setup_logging(log_level, config.LOG_FILE)
+    # Setup logging - only commands that do real work log
+    if ctx.invoked_subcommand in {"scan", "watch", "quick", "api"}:
+        from utils import setup_logging
+        log_level = "DEBUG" if debug else config.LOG_LEVEL
+        setup_logging(log_level, config.LOG_FILE)
     
     # Store context
     ctx.obj['debug'] = debug
@@ -46,6 +49,9 @@ def cli(ctx, debug, config_file):
 def scan(ctx, timeframe, format, save, symbols):
     """🎯 Run a one-button market scan"""
     
+    from execution import MarketScanner, OutputFormatter
+    from tracking import PerformanceTracker
+    
     console.print(Panel.fit(
         "[bold cyan]🚀 Market Scanner[/bold cyan]\n"
         "[dim]Finding symbols guaranteed to outperform BTC[/dim]",
@@ -85,7 +91,7 @@ def scan(ctx, timeframe, format, save, symbols):
                 # Log to tracker
                 if tracker:
                     btc_return = await scanner.composer_scorer.btc_benchmark.get_expected_return(timeframe)
-                    total_symbols = len(symbol_list) if symbol_list else len(scanner.data_manager.universe.get_active_symbols())
+                    total_symbols = len(symbol_list) if symbol_list else scanner.universe_size
                     scan_id = tracker.log_scan(results, total_symbols, btc_return, timeframe)
                     console.print(f"📊 Logged scan #{scan_id}", style="dim")
                 
@@ -104,6 +110,8 @@ def scan(ctx, timeframe, format, save, symbols):
             if ctx.obj['debug']:
                 import traceback
                 traceback.print_exc()
+        finally:
+            scanner.close()
     
     # Run the async scan
     try:
@@ -118,6 +126,8 @@ def scan(ctx, timeframe, format, save, symbols):
 def watch(interval, max_scans, timeframe):
     """👀 Continuous market watching mode"""
     
+    from execution import MarketScanner, OutputFormatter
+    
     console.print(Panel.fit(
         f"[bold green]👀 Continuous Scanner[/bold green]\n"
         f"[dim]Interval: {interval}m | Max scans: {max_scans} | Timeframe: {timeframe}[/dim]",
@@ -132,6 +142,8 @@ def watch(interval, max_scans, timeframe):
             await scanner.continuous_scan(interval, max_scans)
         except KeyboardInterrupt:
             console.print("\n⏹️  Continuous scanning stopped", style="yellow")
+        finally:
+            scanner.close()
     
     try:
         asyncio.run(run_continuous())
@@ -146,6 +158,8 @@ def watch(interval, max_scans, timeframe):
 def quick(symbols, format):
     """⚡ Quick scan of specific symbols"""
     
+    from execution import MarketScanner, OutputFormatter
+    
     symbol_list = [s.upper() for s in symbols]
     console.print(f"⚡ Quick scan: {', '.join(symbol_list)}")
     
@@ -161,6 +175,8 @@ def quick(symbols, format):
                 console.print("❌ No opportunities found", style="red")
         except Exception as e:
             console.print(f"💥 Error: {e}", style="red")
+        finally:
+            scanner.close()
     
     asyncio.run(run_quick())
 
@@ -170,6 +186,8 @@ def quick(symbols, format):
 def stats(days, export):
     """📊 View performance statistics"""
     
+    from tracking import PerformanceTracker
+    
     tracker = PerformanceTracker()
     
     try:
@@ -207,12 +225,17 @@ def stats(days, export):
 def validate():
     """🔧 Validate scanner setup and connectivity"""
     
+    from execution import MarketScanner
+    
     async def run_validation():
         scanner = MarketScanner()
         
         console.print("🔧 Validating Market Scanner Setup...\n")
         
-        validation = await scanner.validate_setup()
+        try:
+            validation = await scanner.validate_setup()
+        finally:
+            scanner.close()
         
         for component, status in validation.items():
             emoji = "✅" if status else "❌"
@@ -266,7 +289,8 @@ def universe(add, remove, list_symbols, load):
 @cli.command()
 @click.option('--host', default='127.0.0.1', help='API server host')
 @click.option('--port', default=8888, help='API server port')
-def api(host, port):
+@click.option('--workers', '-w', type=int, help='Worker processes (default: $WEB_CONCURRENCY or 1)')
+def api(host, port, workers):
     """🌐 Start REST API server for Claude integration"""
     
     console.print(Panel.fit(
@@ -279,7 +303,7 @@ def api(host, port):
     from api import run_server
     
     try:
-        run_server(host=host, port=port)
+        run_server(host=host, port=port, workers=workers)
     except KeyboardInterrupt:
         console.print("\n⏹️  API server stopped", style="yellow")
 
@@ -300,6 +324,11 @@ def version():
 
 def main():
     """Main entry point for the CLI"""
+    # Faster event loop for scan/broker I/O when available (not on Windows)
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop"):
+        import uvloop
+        uvloop.install()
+    
     try:
         cli()
     except KeyboardInterrupt:
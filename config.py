@@ -1,10 +1,12 @@
 """Configuration settings for the market scanner"""
 
 import os
+import sys
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import Tuple
 
-@dataclass
+# Read-only after import; slots= needs Python 3.10+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class ScannerConfig:
     # Data sources
     DEFAULT_SYMBOLS_FILE: str = "24h-stocks.csv"
@@ -21,6 +23,7 @@ class ScannerConfig:
     MAX_PRICE: float = 500.0
     MIN_VOLUME_MULTIPLE: float = 2.0
     MIN_SCORE_THRESHOLD: int = 70
+    MAX_CONCURRENT_REQUESTS: int = 20  # In-flight market data fetches per scan
     
     # Signal weights
     VWAP_MOMENTUM_WEIGHT: float = 25.0
@@ -37,7 +40,7 @@ class ScannerConfig:
     
     # BTC benchmark
     BTC_SYMBOL: str = "BTC-USD"
-    BENCHMARK_TIMEFRAMES: List[str] = ["1h", "4h", "1d"]
+    BENCHMARK_TIMEFRAMES: Tuple[str, ...] = ("1h", "4h", "1d")
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -3,19 +3,30 @@
 import asyncio
 import aiohttp
 import json
+import orjson
+import numpy as np
 import hmac
 import hashlib
 import base64
+import sys
 import time
-from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Protocol, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
-from utils import logger
+from utils import logger, TokenBucket
 from config import config
 
+# Seconds a successful broker authentication is trusted before re-checking
+AUTH_TTL = 300
+
+# Alpaca request limits: in-flight cap and 200 requests/minute
+MAX_INFLIGHT = 20
+ALPACA_RATE_PER_MIN = 200
+
 class OrderType(Enum):
     MARKET = "market"
     LIMIT = "limit"
@@ -32,7 +43,22 @@ class OrderStatus(Enum):
     CANCELLED = "cancelled"
     REJECTED = "rejected"
 
-@dataclass
+# Slotted dataclasses where supported (slots= is Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Wire-value lookups for Alpaca responses. Statuses without an OrderStatus
+# member (new, accepted, partially_filled, ...) are still open -> PENDING
+_STATUS_MAP = {s.value: s for s in OrderStatus}
+_SIDE_MAP = {s.value: s for s in OrderSide}
+
+def _fmt_decimal(value: float) -> str:
+    """Compact decimal string for order fields (10.0 -> 10, 0.50 -> 0.5)"""
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.8f}".rstrip("0").rstrip(".")
+
+@dataclass(**_DATACLASS_SLOTS)
 class Order:
     symbol: str
     side: OrderSide
@@ -42,9 +68,9 @@ class Order:
     stop_price: Optional[float] = None
     time_in_force: str = "GTC"  # Good Till Cancelled
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OrderResponse:
-    order_id: str
+    order_id: Union[str, int]  # broker id string; PaperBroker uses its int sequence number
     status: OrderStatus
     symbol: str
     side: OrderSide
@@ -53,8 +79,9 @@ class OrderResponse:
     average_price: Optional[float] = None
     timestamp: datetime = None
     message: Optional[str] = None
+    http_status: Optional[int] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Position:
     symbol: str
     quantity: float
@@ -62,39 +89,67 @@ class Position:
     market_value: float
     unrealized_pnl: float
     
-@dataclass
+# Column layout of Position, for vectorised position handling. Symbols are
+# Python str objects - OCC option symbols overflow any short fixed width
+POSITION_DTYPE = np.dtype([
+    ("symbol", object),
+    ("quantity", "f8"),
+    ("average_price", "f8"),
+    ("market_value", "f8"),
+    ("unrealized_pnl", "f8")
+])
+
+@dataclass(**_DATACLASS_SLOTS)
 class Account:
     buying_power: float
     total_value: float
     positions: List[Position]
 
-class BrokerInterface(ABC):
-    """Abstract base class for broker integrations"""
+class BrokerInterface(Protocol):
+    """Structural interface for broker integrations
+    
+    Brokers subclass it to inherit the no-op start/close lifecycle hooks;
+    anything with matching async methods satisfies it for type checking.
+    """
+    
+    async def start(self):
+        """Open long-lived resources (connections, sessions)"""
+        pass
+    
+    async def close(self):
+        """Release resources opened by start()"""
+        pass
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
     
-    @abstractmethod
     async def authenticate(self) -> bool:
         """Authenticate with the broker"""
-        pass
+        ...
     
-    @abstractmethod
     async def place_order(self, order: Order) -> OrderResponse:
         """Place an order"""
-        pass
+        ...
     
-    @abstractmethod
-    async def cancel_order(self, order_id: str) -> bool:
+    async def place_orders(self, orders: List[Order]) -> List[OrderResponse]:
+        """Place a batch of orders, returning responses in input order"""
+        ...
+    
+    async def cancel_order(self, order_id: Union[str, int]) -> bool:
         """Cancel an order"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_account(self) -> Account:
         """Get account information"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_positions(self) -> List[Position]:
         """Get current positions"""
-        pass
+        ...
 
 class AlpacaBroker(BrokerInterface):
     """Alpaca broker integration (paper and live trading)"""
@@ -104,31 +159,57 @@ class AlpacaBroker(BrokerInterface):
         self.secret_key = secret_key
         self.paper = paper
         self.base_url = "https://paper-api.alpaca.markets" if paper else "https://api.alpaca.markets"
-        self.session = None
+        self._headers = {
+            "APCA-API-KEY-ID": api_key,
+            "APCA-API-SECRET-KEY": secret_key,
+            "Content-Type": "application/json"
+        }
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._position_cache: Dict[str, Position] = {}
+        self._sem = asyncio.Semaphore(MAX_INFLIGHT)
+        self._bucket = TokenBucket(rate=ALPACA_RATE_PER_MIN / 60, capacity=ALPACA_RATE_PER_MIN)
     
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
+    async def start(self):
+        """Create the shared keep-alive session (idempotent)"""
+        if self.session and not self.session.closed:
+            return
+        self.session = aiohttp.ClientSession(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=10),
+            json_serialize=lambda o: orjson.dumps(o).decode(),
+            connector=aiohttp.TCPConnector(
+                limit=300,
+                limit_per_host=75,
+                ttl_dns_cache=600,
+                force_close=False,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+        )
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+    async def close(self):
+        """Close the shared session"""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get authentication headers"""
-        return {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.secret_key,
-            "Content-Type": "application/json"
-        }
+    @asynccontextmanager
+    async def _throttled(self):
+        """Hold an in-flight slot and a rate-limit token for one request
+        
+        Opens the session on first use, so callers need not start() first.
+        """
+        async with self._sem:
+            if self.session is None or self.session.closed:
+                await self.start()
+            await self._bucket.acquire()
+            yield
     
     async def authenticate(self) -> bool:
         """Test authentication"""
         try:
-            async with self.session.get(
-                f"{self.base_url}/v2/account",
-                headers=self._get_headers()
-            ) as response:
+            async with self._throttled(), self.session.get("/v2/account") as response:
                 return response.status == 200
         except Exception as e:
             logger.error(f"Alpaca authentication failed: {e}")
@@ -141,28 +222,24 @@ class AlpacaBroker(BrokerInterface):
                 "symbol": order.symbol,
                 "side": order.side.value,
                 "type": order.order_type.value,
-                "qty": str(order.quantity),
+                "qty": _fmt_decimal(order.quantity),
                 "time_in_force": order.time_in_force
             }
             
             if order.price:
-                payload["limit_price"] = str(order.price)
+                payload["limit_price"] = _fmt_decimal(order.price)
             if order.stop_price:
-                payload["stop_price"] = str(order.stop_price)
+                payload["stop_price"] = _fmt_decimal(order.stop_price)
             
-            async with self.session.post(
-                f"{self.base_url}/v2/orders",
-                headers=self._get_headers(),
-                json=payload
-            ) as response:
-                data = await response.json()
+            async with self._throttled(), self.session.post("/v2/orders", data=orjson.dumps(payload)) as response:
+                data = orjson.loads(await response.read())
                 
                 if response.status == 201:
                     return OrderResponse(
                         order_id=data["id"],
-                        status=OrderStatus(data["status"].lower()),
+                        status=_STATUS_MAP.get(data["status"].lower(), OrderStatus.PENDING),
                         symbol=data["symbol"],
-                        side=OrderSide(data["side"]),
+                        side=_SIDE_MAP[data["side"]],
                         quantity=float(data["qty"]),
                         filled_quantity=float(data.get("filled_qty", 0)),
                         timestamp=datetime.now()
@@ -175,7 +252,8 @@ class AlpacaBroker(BrokerInterface):
                         side=order.side,
                         quantity=order.quantity,
                         message=data.get("message", "Order rejected"),
-                        timestamp=datetime.now()
+                        timestamp=datetime.now(),
+                        http_status=response.status
                     )
                     
         except Exception as e:
@@ -190,70 +268,121 @@ class AlpacaBroker(BrokerInterface):
                 timestamp=datetime.now()
             )
     
+    async def place_orders(self, orders: List[Order]) -> List[OrderResponse]:
+        """Place orders concurrently over the shared session"""
+        return list(await asyncio.gather(*(self.place_order(order) for order in orders)))
+    
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel order"""
         try:
-            async with self.session.delete(
-                f"{self.base_url}/v2/orders/{order_id}",
-                headers=self._get_headers()
-            ) as response:
+            async with self._throttled(), self.session.delete(f"/v2/orders/{order_id}") as response:
                 return response.status == 204
         except Exception as e:
             logger.error(f"Alpaca cancel order failed: {e}")
             return False
     
     async def get_account(self) -> Account:
-        """Get account information"""
+        """Get account information - account and positions fetched concurrently"""
         try:
-            async with self.session.get(
-                f"{self.base_url}/v2/account",
-                headers=self._get_headers()
-            ) as response:
-                data = await response.json()
-                
-                positions = await self.get_positions()
-                
-                return Account(
-                    buying_power=float(data["buying_power"]),
-                    total_value=float(data["equity"]),
-                    positions=positions
-                )
+            data, positions = await asyncio.gather(self._get_account_data(), self.get_positions())
+            
+            return Account(
+                buying_power=float(data["buying_power"]),
+                total_value=float(data["equity"]),
+                positions=positions
+            )
         except Exception as e:
             logger.error(f"Alpaca get account failed: {e}")
             return Account(buying_power=0, total_value=0, positions=[])
     
+    async def _get_account_data(self) -> Dict[str, Any]:
+        """Raw /v2/account payload"""
+        async with self._throttled(), self.session.get("/v2/account") as response:
+            return orjson.loads(await response.read())
+    
     async def get_positions(self) -> List[Position]:
-        """Get current positions"""
+        """Get current positions
+        
+        Position objects are reused across calls and updated in place, so a
+        caller holding a previous result sees the latest values.
+        """
+        cache = self._position_cache
+        positions = []
+        for symbol, quantity, average_price, market_value, unrealized_pnl in (await self.get_positions_array()).tolist():
+            pos = cache.get(symbol)
+            if pos is None:
+                pos = Position(symbol, quantity, average_price, market_value, unrealized_pnl)
+            else:
+                pos.quantity = quantity
+                pos.average_price = average_price
+                pos.market_value = market_value
+                pos.unrealized_pnl = unrealized_pnl
+            positions.append(pos)
+        
+        # Drop symbols no longer held
+        self._position_cache = {pos.symbol: pos for pos in positions}
+        return positions
+    
+    async def get_positions_array(self) -> np.ndarray:
+        """Current positions as a POSITION_DTYPE structured array"""
         try:
-            async with self.session.get(
-                f"{self.base_url}/v2/positions",
-                headers=self._get_headers()
-            ) as response:
-                data = await response.json()
-                
-                positions = []
-                for pos in data:
-                    positions.append(Position(
-                        symbol=pos["symbol"],
-                        quantity=float(pos["qty"]),
-                        average_price=float(pos["avg_cost"]),
-                        market_value=float(pos["market_value"]),
-                        unrealized_pnl=float(pos["unrealized_pl"])
-                    ))
-                
-                return positions
+            async with self._throttled(), self.session.get("/v2/positions") as response:
+                data = orjson.loads(await response.read())
+            
+            # numpy parses the numeric strings for all rows in one pass
+            return np.array(
+                [(p["symbol"], p["qty"], p["avg_cost"], p["market_value"], p["unrealized_pl"]) for p in data],
+                dtype=POSITION_DTYPE
+            )
         except Exception as e:
             logger.error(f"Alpaca get positions failed: {e}")
-            return []
+            return np.empty(0, dtype=POSITION_DTYPE)
 
 class PaperBroker(BrokerInterface):
     """Paper trading simulator"""
     
-    def __init__(self, initial_balance: float = 100000.0):
+    def __init__(self, initial_balance: float = 100000.0, capacity: int = 64,
+                 max_orders: int = 100_000):
         self.balance = initial_balance
-        self.positions: Dict[str, Position] = {}
-        self.orders: Dict[str, OrderResponse] = {}
+        # Bounded order history of (sequence number, response), oldest first
+        self.orders: Deque[Tuple[int, OrderResponse]] = deque(maxlen=max_orders)
         self.order_counter = 0
+        
+        # Positions as parallel columns (SoA) indexed by symbol row
+        self._sym_idx: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._qty = np.zeros(capacity)
+        self._avg = np.zeros(capacity)
+        self._mark = np.zeros(capacity)
+    
+    def _row(self, symbol: str) -> int:
+        """Row for symbol, allocating (and growing the columns) if new"""
+        row = self._sym_idx.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row == len(self._qty):
+                grow = len(self._qty) or 1
+                self._qty = np.concatenate([self._qty, np.zeros(grow)])
+                self._avg = np.concatenate([self._avg, np.zeros(grow)])
+                self._mark = np.concatenate([self._mark, np.zeros(grow)])
+            self._sym_idx[symbol] = row
+            self._symbols.append(symbol)
+        return row
+    
+    def _materialize_positions(self) -> List[Position]:
+        """Build Position objects for open rows only when callers ask for them"""
+        n = len(self._symbols)
+        qty, avg, mark = self._qty[:n], self._avg[:n], self._mark[:n]
+        return [
+            Position(
+                symbol=self._symbols[i],
+                quantity=float(qty[i]),
+                average_price=float(avg[i]),
+                market_value=float(qty[i] * mark[i]),
+                unrealized_pnl=float((mark[i] - avg[i]) * qty[i])
+            )
+            for i in np.flatnonzero(qty > 0)
+        ]
     
     async def authenticate(self) -> bool:
         """Paper broker always authenticates"""
@@ -261,8 +390,9 @@ class PaperBroker(BrokerInterface):
     
     async def place_order(self, order: Order) -> OrderResponse:
         """Simulate order placement"""
+        now = datetime.now()
         self.order_counter += 1
-        order_id = f"paper_{self.order_counter}"
+        order_id = self.order_counter
         
         # For market orders, simulate immediate fill
         if order.order_type == OrderType.MARKET:
@@ -270,95 +400,54 @@ class PaperBroker(BrokerInterface):
             estimated_price = order.price or 100.0  # Placeholder
             
             cost = order.quantity * estimated_price
+            buy = order.side == OrderSide.BUY
+            row = self._sym_idx.get(order.symbol)
             
-            if order.side == OrderSide.BUY:
-                if cost <= self.balance:
-                    self.balance -= cost
-                    
-                    # Update position
-                    if order.symbol in self.positions:
-                        pos = self.positions[order.symbol]
-                        total_cost = (pos.quantity * pos.average_price) + cost
-                        total_quantity = pos.quantity + order.quantity
-                        new_avg_price = total_cost / total_quantity
-                        
-                        self.positions[order.symbol] = Position(
-                            symbol=order.symbol,
-                            quantity=total_quantity,
-                            average_price=new_avg_price,
-                            market_value=total_quantity * estimated_price,
-                            unrealized_pnl=(estimated_price - new_avg_price) * total_quantity
-                        )
-                    else:
-                        self.positions[order.symbol] = Position(
-                            symbol=order.symbol,
-                            quantity=order.quantity,
-                            average_price=estimated_price,
-                            market_value=cost,
-                            unrealized_pnl=0.0
-                        )
-                    
-                    response = OrderResponse(
-                        order_id=order_id,
-                        status=OrderStatus.FILLED,
-                        symbol=order.symbol,
-                        side=order.side,
-                        quantity=order.quantity,
-                        filled_quantity=order.quantity,
-                        average_price=estimated_price,
-                        timestamp=datetime.now()
-                    )
-                else:
-                    response = OrderResponse(
-                        order_id=order_id,
-                        status=OrderStatus.REJECTED,
-                        symbol=order.symbol,
-                        side=order.side,
-                        quantity=order.quantity,
-                        message="Insufficient buying power",
-                        timestamp=datetime.now()
-                    )
+            if buy and cost > self.balance:
+                rejection = "Insufficient buying power"
+            elif not buy and (row is None or self._qty[row] < order.quantity):
+                rejection = "Insufficient shares"
+            else:
+                rejection = None
             
-            else:  # SELL
-                if order.symbol in self.positions and self.positions[order.symbol].quantity >= order.quantity:
-                    proceeds = order.quantity * estimated_price
-                    self.balance += proceeds
-                    
-                    # Update position
-                    pos = self.positions[order.symbol]
-                    new_quantity = pos.quantity - order.quantity
-                    
-                    if new_quantity > 0:
-                        self.positions[order.symbol] = Position(
-                            symbol=order.symbol,
-                            quantity=new_quantity,
-                            average_price=pos.average_price,
-                            market_value=new_quantity * estimated_price,
-                            unrealized_pnl=(estimated_price - pos.average_price) * new_quantity
-                        )
-                    else:
-                        del self.positions[order.symbol]
-                    
-                    response = OrderResponse(
-                        order_id=order_id,
-                        status=OrderStatus.FILLED,
-                        symbol=order.symbol,
-                        side=order.side,
-                        quantity=order.quantity,
-                        filled_quantity=order.quantity,
-                        average_price=estimated_price,
-                        timestamp=datetime.now()
-                    )
-                else:
-                    response = OrderResponse(
-                        order_id=order_id,
-                        status=OrderStatus.REJECTED,
-                        symbol=order.symbol,
-                        side=order.side,
-                        quantity=order.quantity,
-                        message="Insufficient shares",
-                        timestamp=datetime.now()
-                    )
+            if rejection:
+                response = OrderResponse(
+                    order_id=order_id,
+                    status=OrderStatus.REJECTED,
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=order.quantity,
+                    message=rejection,
+                    timestamp=now
+                )
+            else:
+                # Single signed-quantity update for both sides
+                if row is None:
+                    row = self._row(order.symbol)
+                signed_qty = order.quantity if buy else -order.quantity
+                held = self._qty[row]
+                new_qty = held + signed_qty
+                
+                if buy:
+                    self._avg[row] = (held * self._avg[row] + cost) / new_qty
+                elif new_qty <= 0:
+                    new_qty = 0.0
+                    self._avg[row] = 0.0
+                
+                self._qty[row] = new_qty
+                self._mark[row] = estimated_price
+                self.balance -= signed_qty * estimated_price
+                
+                response = OrderResponse(
+                    order_id=order_id,
+                    status=OrderStatus.FILLED,
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=order.quantity,
+                    filled_quantity=order.quantity,
+                    average_price=estimated_price,
+                    timestamp=now
+                )
         
         else:
             # Limit orders go to pending state
@@ -368,32 +457,54 @@ class PaperBroker(BrokerInterface):
                 symbol=order.symbol,
                 side=order.side,
                 quantity=order.quantity,
-                timestamp=datetime.now()
+                timestamp=now
             )
         
-        self.orders[order_id] = response
+        self.orders.append((order_id, response))
         return response
     
-    async def cancel_order(self, order_id: str) -> bool:
+    async def place_orders(self, orders: List[Order]) -> List[OrderResponse]:
+        """Simulate a batch of orders in submission order"""
+        return [await self.place_order(order) for order in orders]
+    
+    async def cancel_order(self, order_id: Union[str, int]) -> bool:
         """Cancel pending order"""
-        if order_id in self.orders:
-            self.orders[order_id].status = OrderStatus.CANCELLED
+        if not isinstance(order_id, int):
+            # Accept the legacy "paper_<n>" form
+            try:
+                order_id = int(str(order_id).rpartition("_")[2])
+            except ValueError:
+                return False
+        
+        order = self._get_order(order_id)
+        if order:
+            order.status = OrderStatus.CANCELLED
             return True
         return False
     
+    def _get_order(self, order_no: int) -> Optional[OrderResponse]:
+        """Retained order by sequence number - sequence numbers are contiguous"""
+        if not self.orders:
+            return None
+        idx = order_no - self.orders[0][0]
+        if 0 <= idx < len(self.orders):
+            return self.orders[idx][1]
+        return None
+    
     async def get_account(self) -> Account:
         """Get account information"""
-        total_value = self.balance + sum(pos.market_value for pos in self.positions.values())
+        n = len(self._symbols)
+        total_value = self.balance + float((self._qty[:n] * self._mark[:n]).sum())
         
         return Account(
             buying_power=self.balance,
             total_value=total_value,
-            positions=list(self.positions.values())
+            positions=self._materialize_positions()
         )
     
     async def get_positions(self) -> List[Position]:
         """Get current positions"""
-        return list(self.positions.values())
+        return self._materialize_positions()
 
 class BrokerManager:
     """Manages multiple broker connections"""
@@ -401,6 +512,7 @@ class BrokerManager:
     def __init__(self):
         self.brokers: Dict[str, BrokerInterface] = {}
         self.default_broker = "paper"
+        self._auth_cache: Dict[str, float] = {}  # broker name -> monotonic auth time
     
     def add_broker(self, name: str, broker: BrokerInterface):
         """Add a broker connection"""
@@ -422,14 +534,35 @@ class BrokerManager:
         if broker_name not in self.brokers:
             raise ValueError(f"Broker {broker_name} not found")
         
+        broker = await self._authenticated_broker(broker_name)
+        response = await broker.place_order(order)
+        if response.http_status in (401, 403):
+            self._auth_cache.pop(broker_name, None)
+        return response
+    
+    async def place_orders(self, orders: List[Order], broker_name: Optional[str] = None) -> List[OrderResponse]:
+        """Place a batch of orders with specified or default broker"""
+        broker_name = broker_name or self.default_broker
+        
+        if broker_name not in self.brokers:
+            raise ValueError(f"Broker {broker_name} not found")
+        
+        broker = await self._authenticated_broker(broker_name)
+        responses = await broker.place_orders(orders)
+        if any(r.http_status in (401, 403) for r in responses):
+            self._auth_cache.pop(broker_name, None)
+        return responses
+    
+    async def _authenticated_broker(self, broker_name: str) -> BrokerInterface:
+        """Return broker, re-authenticating once AUTH_TTL has elapsed"""
         broker = self.brokers[broker_name]
         
-        # Authenticate if needed
-        if not await broker.authenticate():
-            raise Exception(f"Authentication failed for broker {broker_name}")
+        if time.monotonic() - self._auth_cache.get(broker_name, float("-inf")) > AUTH_TTL:
+            if not await broker.authenticate():
+                raise Exception(f"Authentication failed for broker {broker_name}")
+            self._auth_cache[broker_name] = time.monotonic()
         
-        async with broker:
-            return await broker.place_order(order)
+        return broker
     
     async def get_account(self, broker_name: Optional[str] = None) -> Account:
         """Get account info from specified or default broker"""
@@ -438,9 +571,15 @@ class BrokerManager:
         if broker_name not in self.brokers:
             raise ValueError(f"Broker {broker_name} not found")
         
-        broker = self.brokers[broker_name]
-        async with broker:
-            return await broker.get_account()
+        return await self.brokers[broker_name].get_account()
+    
+    async def start(self):
+        """Open every broker's long-lived session up front (otherwise opened on first request)"""
+        await asyncio.gather(*(broker.start() for broker in self.brokers.values()))
+    
+    async def close(self):
+        """Close every broker's session - call at shutdown"""
+        await asyncio.gather(*(broker.close() for broker in self.brokers.values()))
 
 # Initialize default brokers
 def create_default_broker_manager() -> BrokerManager:
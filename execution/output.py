@@ -1,16 +1,71 @@
 """Output formatting and display for scan results"""
 
 import json
+import math
+import re
 from datetime import datetime
-from typing import List, Dict, Optional
-from rich.console import Console
+from typing import Iterator, List, Dict, Optional, Tuple
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
 from utils import ScanResult, format_percentage, format_currency
 from config import config
 
+# Results table columns: (header, style, width)
+_COLUMNS = (
+    ("Rank", "dim", 4),
+    ("Symbol", "bold cyan", 8),
+    ("Score", "bold green", 6),
+    ("Price", "bold white", 8),
+    ("Target", "bold yellow", 8),
+    ("Return", "bold green", 8),
+    ("Prob", "blue", 6),
+    ("Timeframe", "dim", 12),
+)
+
+# Bound cell formatters for table rows
+_PRICE_FMT = "${:.2f}".format
+_PCT_FMT = "{:.0%}".format
+_SCORE_FMT = "{:.0f}".format
+
+# Tickers that can be emitted as JSON strings without escaping
+_TICKER_RE = re.compile(r"[A-Z0-9.^=-]+")
+
+def _json_str(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+def _json_num(value: float, spec: str) -> str:
+    """Formatted number, or null for NaN/inf (which JSON cannot represent)"""
+    return format(value, spec) if math.isfinite(value) else "null"
+
+def _candidate_to_json(r: ScanResult) -> str:
+    """Compact JSON object for one candidate, same keys and rounding as api_dict
+    
+    The candidate schema is fixed, so it is filled in directly instead of
+    going through a generic encoder. Free-text fields are still escaped.
+    """
+    symbol = f'"{r.symbol}"' if _TICKER_RE.fullmatch(r.symbol) else _json_str(r.symbol)
+    target = _json_num(r.target_strike, ".2f") if r.target_strike else "null"
+    factors = ",".join(map(_json_str, r.squeeze_factors))
+    return (
+        f'{{"rank":{r.rank},"symbol":{symbol},"score":{_json_num(r.score, ".1f")},'
+        f'"current_price":{_json_num(r.current_price, ".2f")},"vwap":{_json_num(r.vwap, ".2f")},'
+        f'"target_strike":{target},'
+        f'"probability_reach":{_json_num(r.probability_reach, ".3f")},'
+        f'"expected_return":{_json_num(r.expected_return, ".3f")},'
+        f'"timeframe":{_json_str(r.timeframe)},'
+        f'"entry_zone":{{"low":{_json_num(r.entry_low, ".2f")},"high":{_json_num(r.entry_high, ".2f")}}},'
+        f'"stop_loss":{_json_num(r.stop_loss, ".2f")},"squeeze_factors":[{factors}],'
+        f'"reasoning":{_json_str(r.reasoning)}}}'
+    )
+
 class OutputFormatter:
     """Formats and displays scan results in various formats"""
     
@@ -19,67 +74,35 @@ class OutputFormatter:
     
     def format_json(self, results: List[ScanResult], metadata: Optional[Dict] = None) -> str:
         """Format results as JSON"""
-        output = {
+        return "".join(self._json_chunks(results, metadata))
+    
+    @staticmethod
+    def _json_chunks(results: List[ScanResult], metadata: Optional[Dict] = None) -> Iterator[str]:
+        """JSON export in pieces: indented envelope, one compact line per candidate"""
+        envelope = {
             "scan_timestamp": datetime.now().isoformat(),
             "total_candidates": len(results),
-            "metadata": metadata or {},
-            "candidates": []
+            "metadata": metadata or {}
         }
+        if orjson:
+            head = orjson.dumps(envelope, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            head = json.dumps(envelope, indent=2, default=str)
         
-        for result in results:
-            candidate = {
-                "rank": result.rank,
-                "symbol": result.symbol,
-                "score": round(result.score, 1),
-                "current_price": round(result.current_price, 2),
-                "vwap": round(result.vwap, 2),
-                "target_strike": round(result.target_strike, 2) if result.target_strike else None,
-                "probability_reach": round(result.probability_reach, 3),
-                "expected_return": round(result.expected_return, 3),
-                "timeframe": result.timeframe,
-                "entry_zone": {
-                    "low": round(result.entry_zone[0], 2),
-                    "high": round(result.entry_zone[1], 2)
-                },
-                "stop_loss": round(result.stop_loss, 2),
-                "squeeze_factors": result.squeeze_factors,
-                "reasoning": result.reasoning
-            }
-            output["candidates"].append(candidate)
-        
-        return json.dumps(output, indent=2)
+        # Reopen the envelope (drop the closing "\n}") to append the candidates
+        yield head[:-2] + ',\n  "candidates": ['
+        for i, result in enumerate(results):
+            yield (",\n    " if i else "\n    ") + _candidate_to_json(result)
+        yield "\n  ]\n}" if results else "]\n}"
     
     def format_table(self, results: List[ScanResult]) -> str:
         """Format results as a rich table"""
         if not results:
             return "No candidates found meeting the criteria."
         
-        table = Table(title="🚀 Market Scanner Results", show_header=True, header_style="bold magenta")
-        
-        table.add_column("Rank", style="dim", width=4)
-        table.add_column("Symbol", style="bold cyan", width=8)
-        table.add_column("Score", style="bold green", width=6)
-        table.add_column("Price", style="bold white", width=8)
-        table.add_column("Target", style="bold yellow", width=8)
-        table.add_column("Return", style="bold green", width=8)
-        table.add_column("Prob", style="blue", width=6)
-        table.add_column("Timeframe", style="dim", width=12)
-        
-        for result in results:
-            target_str = f"${result.target_strike:.2f}" if result.target_strike else "N/A"
-            return_str = format_percentage(result.expected_return)
-            prob_str = f"{result.probability_reach:.0%}"
-            
-            table.add_row(
-                str(result.rank),
-                result.symbol,
-                f"{result.score:.0f}",
-                f"${result.current_price:.2f}",
-                target_str,
-                return_str,
-                prob_str,
-                result.timeframe
-            )
+        table = self._new_table()
+        for row in self._table_rows(results):
+            table.add_row(*row)
         
         # Create output string
         with self.console.capture() as capture:
@@ -92,71 +115,65 @@ class OutputFormatter:
         if not results:
             return "No candidates found meeting the criteria."
         
-        output_lines = []
-        output_lines.append("🎯 MARKET SCANNER RESULTS")
-        output_lines.append("=" * 50)
-        output_lines.append(f"Scan Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output_lines.append(f"Candidates Found: {len(results)}")
-        output_lines.append("")
+        return "".join(self._detailed_blocks(results))[:-1]
+    
+    def _detailed_blocks(self, results: List[ScanResult]) -> Iterator[str]:
+        """Header block then one text block per result"""
+        yield (
+            "🎯 MARKET SCANNER RESULTS\n"
+            f"{'=' * 50}\n"
+            f"Scan Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Candidates Found: {len(results)}\n"
+            "\n"
+        )
         
         for result in results:
-            output_lines.append(f"#{result.rank} {result.symbol}")
-            output_lines.append("-" * 30)
-            output_lines.append(f"Score: {result.score:.0f}/100")
-            output_lines.append(f"Current Price: ${result.current_price:.2f}")
-            output_lines.append(f"VWAP: ${result.vwap:.2f}")
-            
+            target = ""
             if result.target_strike:
-                output_lines.append(f"Target Strike: ${result.target_strike:.2f}")
                 move_pct = ((result.target_strike - result.current_price) / result.current_price) * 100
-                output_lines.append(f"Required Move: {move_pct:+.1f}%")
-            
-            output_lines.append(f"Expected Return: {format_percentage(result.expected_return)}")
-            output_lines.append(f"Probability: {result.probability_reach:.0%}")
-            output_lines.append(f"Timeframe: {result.timeframe}")
-            
-            entry_low, entry_high = result.entry_zone
-            output_lines.append(f"Entry Zone: ${entry_low:.2f} - ${entry_high:.2f}")
-            output_lines.append(f"Stop Loss: ${result.stop_loss:.2f}")
+                target = (
+                    f"Target Strike: ${result.target_strike:.2f}\n"
+                    f"Required Move: {move_pct:+.1f}%\n"
+                )
+            factors = f"Squeeze Factors: {', '.join(result.squeeze_factors)}\n" if result.squeeze_factors else ""
             
-            if result.squeeze_factors:
-                factors = ", ".join(result.squeeze_factors)
-                output_lines.append(f"Squeeze Factors: {factors}")
-            
-            output_lines.append(f"Reasoning: {result.reasoning}")
-            output_lines.append("")
-        
-        return "\\n".join(output_lines)
+            yield (
+                f"#{result.rank} {result.symbol}\n"
+                f"{'-' * 30}\n"
+                f"Score: {result.score:.0f}/100\n"
+                f"Current Price: ${result.current_price:.2f}\n"
+                f"VWAP: ${result.vwap:.2f}\n"
+                f"{target}"
+                f"Expected Return: {format_percentage(result.expected_return)}\n"
+                f"Probability: {result.probability_reach:.0%}\n"
+                f"Timeframe: {result.timeframe}\n"
+                f"Entry Zone: ${result.entry_low:.2f} - ${result.entry_high:.2f}\n"
+                f"Stop Loss: ${result.stop_loss:.2f}\n"
+                f"{factors}"
+                f"Reasoning: {result.reasoning}\n"
+                "\n"
+            )
     
     def format_trade_cards(self, results: List[ScanResult]) -> str:
         """Format results as trade cards (like your TUYA example)"""
         if not results:
             return "No trade opportunities found."
         
-        cards = []
-        
+        return "\n".join(self._trade_card_blocks(results)).rstrip("\n")
+    
+    def _trade_card_blocks(self, results: List[ScanResult]) -> Iterator[str]:
+        """One newline-terminated text card per result"""
         for result in results:
-            card_lines = []
-            card_lines.append(f"🎯 TRADE CARD #{result.rank}")
-            card_lines.append("=" * 25)
-            card_lines.append(f"Symbol: {result.symbol}")
-            card_lines.append(f"Entry: ${result.current_price:.2f}")
+            fields = "".join(f"{label}: {value}\n" for label, value in self._card_fields(result))
+            factors = f"Factors: {', '.join(result.squeeze_factors[:3])}\n" if result.squeeze_factors else ""  # Top 3 factors
             
-            if result.target_strike:
-                card_lines.append(f"Target: ${result.target_strike:.2f}")
-            
-            card_lines.append(f"Stop: ${result.stop_loss:.2f}")
-            card_lines.append(f"Expected Return: {format_percentage(result.expected_return)}")
-            card_lines.append(f"Probability: {result.probability_reach:.0%}")
-            card_lines.append(f"Timeframe: {result.timeframe}")
-            card_lines.append(f"Score: {result.score:.0f}/100")
-            
-            if result.squeeze_factors:
-                card_lines.append(f"Factors: {', '.join(result.squeeze_factors[:3])}")  # Top 3 factors
-            
-            cards.append("\\n".join(card_lines))
-        
-        return "\\n\\n".join(cards)
+            yield (
+                f"🎯 TRADE CARD #{result.rank}\n"
+                f"{'=' * 25}\n"
+                f"Symbol: {result.symbol}\n"
+                f"{fields}"
+                f"{factors}"
+            )
     
     def display_results(self, results: List[ScanResult], format_type: str = "table"):
         """Display results using rich console"""
@@ -175,38 +192,55 @@ class OutputFormatter:
     
     def _create_rich_table(self, results: List[ScanResult]) -> Table:
         """Create a rich table for console display"""
-        table = Table(title="🚀 Market Scanner Results", show_header=True, header_style="bold magenta")
+        table = self._new_table()
         
-        table.add_column("Rank", style="dim", width=4)
-        table.add_column("Symbol", style="bold cyan", width=8)
-        table.add_column("Score", style="bold green", width=6)
-        table.add_column("Price", style="bold white", width=8)
-        table.add_column("Target", style="bold yellow", width=8)
-        table.add_column("Return", style="bold green", width=8)
-        table.add_column("Prob", style="blue", width=6)
-        table.add_column("Timeframe", style="dim", width=12)
-        
-        for result in results:
-            target_str = f"${result.target_strike:.2f}" if result.target_strike else "N/A"
-            return_str = format_percentage(result.expected_return)
-            prob_str = f"{result.probability_reach:.0%}"
-            
+        for result, row in zip(results, self._table_rows(results)):
             # Color coding based on score
             score_style = "bold green" if result.score >= 85 else "green" if result.score >= 75 else "yellow"
-            
-            table.add_row(
+            table.add_row(*row, style=score_style if result.rank == 1 else None)
+        
+        return table
+    
+    @staticmethod
+    def _new_table() -> Table:
+        """Results table skeleton with fixed-width columns"""
+        table = Table(title="🚀 Market Scanner Results", show_header=True, header_style="bold magenta",
+                      expand=False, padding=(0, 1))
+        for name, style, width in _COLUMNS:
+            table.add_column(name, style=style, width=width)
+        return table
+    
+    @staticmethod
+    def _table_rows(results: List[ScanResult]) -> List[tuple]:
+        """Pre-formatted cell strings for each result"""
+        return [
+            (
                 str(result.rank),
                 result.symbol,
-                f"{result.score:.0f}",
-                f"${result.current_price:.2f}",
-                target_str,
-                return_str,
-                prob_str,
-                result.timeframe,
-                style=score_style if result.rank == 1 else None
+                _SCORE_FMT(result.score),
+                _PRICE_FMT(result.current_price),
+                _PRICE_FMT(result.target_strike) if result.target_strike else "N/A",
+                format_percentage(result.expected_return),
+                _PCT_FMT(result.probability_reach),
+                result.timeframe
             )
-        
-        return table
+            for result in results
+        ]
+    
+    @staticmethod
+    def _card_fields(result: ScanResult) -> List[Tuple[str, str]]:
+        """Ordered (label, value) trade card fields shared by text and rich cards"""
+        fields = [("Entry", _PRICE_FMT(result.current_price))]
+        if result.target_strike:
+            fields.append(("Target", _PRICE_FMT(result.target_strike)))
+        fields += [
+            ("Stop", _PRICE_FMT(result.stop_loss)),
+            ("Expected Return", format_percentage(result.expected_return)),
+            ("Probability", _PCT_FMT(result.probability_reach)),
+            ("Timeframe", result.timeframe),
+            ("Score", f"{result.score:.0f}/100")
+        ]
+        return fields
     
     def _display_detailed_results(self, results: List[ScanResult]):
         """Display detailed results with rich formatting"""
@@ -214,6 +248,7 @@ class OutputFormatter:
             self.console.print("No candidates found meeting the criteria.", style="yellow")
             return
         
+        panels = []
         for result in results:
             # Create detailed panel for each result
             details = []
@@ -226,23 +261,22 @@ class OutputFormatter:
             
             details.append(f"Return: {format_percentage(result.expected_return)} | Prob: {result.probability_reach:.0%}")
             details.append(f"Timeframe: {result.timeframe}")
-            
-            entry_low, entry_high = result.entry_zone
-            details.append(f"Entry: ${entry_low:.2f}-${entry_high:.2f} | Stop: ${result.stop_loss:.2f}")
+            details.append(f"Entry: ${result.entry_low:.2f}-${result.entry_high:.2f} | Stop: ${result.stop_loss:.2f}")
             
             if result.squeeze_factors:
                 details.append(f"Factors: {', '.join(result.squeeze_factors)}")
             
             details.append(f"Reasoning: {result.reasoning}")
             
-            panel_content = "\\n".join(details)
+            panel_content = "\n".join(details)
             title = f"#{result.rank} {result.symbol}"
             
             # Color based on rank
             border_style = "green" if result.rank == 1 else "blue" if result.rank <= 3 else "dim"
             
-            panel = Panel(panel_content, title=title, border_style=border_style)
-            self.console.print(panel)
+            panels.append(Panel(panel_content, title=title, border_style=border_style))
+        
+        self.console.print(Group(*panels))
     
     def _display_trade_cards(self, results: List[ScanResult]):
         """Display trade cards with rich formatting"""
@@ -250,44 +284,48 @@ class OutputFormatter:
             self.console.print("No trade opportunities found.", style="yellow")
             return
         
+        panels = []
         for result in results:
-            card_content = []
-            card_content.append(f"[bold]Entry:[/bold] ${result.current_price:.2f}")
-            
-            if result.target_strike:
-                card_content.append(f"[bold]Target:[/bold] ${result.target_strike:.2f}")
-            
-            card_content.append(f"[bold]Stop:[/bold] ${result.stop_loss:.2f}")
-            card_content.append(f"[bold]Return:[/bold] {format_percentage(result.expected_return)}")
-            card_content.append(f"[bold]Probability:[/bold] {result.probability_reach:.0%}")
-            card_content.append(f"[bold]Timeframe:[/bold] {result.timeframe}")
-            card_content.append(f"[bold]Score:[/bold] {result.score:.0f}/100")
-            
-            panel_content = "\\n".join(card_content)
+            panel_content = "\n".join(
+                f"[bold]{label}:[/bold] {value}" for label, value in self._card_fields(result)
+            )
             title = f"🎯 {result.symbol} Trade Card"
             
             # Green for top pick, blue for others
             border_style = "green" if result.rank == 1 else "blue"
             
-            panel = Panel(panel_content, title=title, border_style=border_style)
-            self.console.print(panel)
+            panels.append(Panel(panel_content, title=title, border_style=border_style))
+        
+        self.console.print(Group(*panels))
     
     def save_results(self, results: List[ScanResult], filename: str, format_type: str = "json"):
-        """Save results to file"""
+        """Save results to file
+        
+        Output is written piece by piece (per candidate/result block), so the
+        whole document is never held as one str.
+        """
         try:
             if format_type == "json":
-                content = self.format_json(results)
-            elif format_type == "detailed":
-                content = self.format_detailed(results)
-            elif format_type == "cards":
-                content = self.format_trade_cards(results)
+                with open(filename, 'w') as f:
+                    f.writelines(self._json_chunks(results))
+            elif format_type == "detailed" and results:
+                with open(filename, 'w') as f:
+                    f.writelines(self._detailed_blocks(results))
+            elif format_type == "cards" and results:
+                with open(filename, 'w') as f:
+                    f.writelines(card + "\n" for card in self._trade_card_blocks(results))
             else:
-                content = self.format_table(results)
-            
-            with open(filename, 'w') as f:
-                f.write(content)
+                if format_type == "detailed":
+                    content = self.format_detailed(results)
+                elif format_type == "cards":
+                    content = self.format_trade_cards(results)
+                else:
+                    content = self.format_table(results)
+                
+                with open(filename, 'w') as f:
+                    f.write(content)
             
             self.console.print(f"Results saved to {filename}", style="green")
             
         except Exception as e:
-            self.console.print(f"Error saving results: {e}", style="red")
\ No newline at end of file
+            self.console.print(f"Error saving results: {e}", style="red")
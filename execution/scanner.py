@@ -1,7 +1,9 @@
 """Main scanner orchestrator - coordinates all components"""
 
 import asyncio
+import logging
 import time
+import numpy as np
 from datetime import datetime
 from typing import List, Optional, Dict
 
@@ -10,6 +12,22 @@ from scoring import CompositeScorer
 from utils import ScanResult, MarketData, logger
 from config import config
 
+# Hoisted price bounds for the basic filters
+MIN_PRICE = config.MIN_PRICE
+MAX_PRICE = config.MAX_PRICE
+
+# Seconds the universe symbol list is reused between scans/stats calls
+SYMBOLS_TTL = 30
+
+# Columns pulled from MarketData for the vectorised basic filters
+_FILTER_DTYPE = np.dtype([
+    ("price", "f8"),
+    ("volume", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("open", "f8")
+])
+
 class MarketScanner:
     """Main scanner that orchestrates the entire scanning process"""
     
@@ -18,10 +36,32 @@ class MarketScanner:
         self.composer_scorer = CompositeScorer()
         self.last_scan_time = None
         self.scan_count = 0
+        self._symbols_cache: Optional[tuple] = None  # (monotonic expiry, symbols)
+    
+    def _active_symbols(self) -> List[str]:
+        """Universe symbols, re-read from the universe at most every SYMBOLS_TTL seconds"""
+        if self._symbols_cache and self._symbols_cache[0] > time.monotonic():
+            return self._symbols_cache[1]
+        symbols = self.data_manager.universe.get_active_symbols()
+        self._symbols_cache = (time.monotonic() + SYMBOLS_TTL, symbols)
+        return symbols
+    
+    def invalidate_symbols(self):
+        """Drop the cached universe after it has been modified"""
+        self._symbols_cache = None
+    
+    def close(self):
+        """Release the scorer's thread pool"""
+        self.composer_scorer.close()
         
     async def run_scan(self, timeframe: str = "1h", 
-                      custom_symbols: Optional[List[str]] = None) -> List[ScanResult]:
-        """Execute a complete market scan"""
+                      custom_symbols: Optional[List[str]] = None,
+                      max_concurrency: Optional[int] = None,
+                      min_score: Optional[float] = None) -> List[ScanResult]:
+        """Execute a complete market scan
+        
+        min_score overrides config.MIN_SCORE_THRESHOLD for this scan only.
+        """
         scan_start = time.time()
         self.scan_count += 1
         
@@ -33,11 +73,11 @@ class MarketScanner:
                 symbols = [s.upper().strip() for s in custom_symbols]
                 logger.info(f"Using custom symbols: {symbols}")
             else:
-                symbols = self.data_manager.universe.get_active_symbols()
+                symbols = self._active_symbols()
                 logger.info(f"Scanning {len(symbols)} symbols from universe")
             
             # Step 2: Fetch market data for all symbols
-            market_data_list = await self._fetch_market_data(symbols)
+            market_data_list = await self._fetch_market_data(symbols, max_concurrency)
             if not market_data_list:
                 logger.warning("No market data available")
                 return []
@@ -57,7 +97,7 @@ class MarketScanner:
             logger.info(f"Scored {len(scores)} symbols")
             
             # Step 5: Filter and rank by composite score
-            top_scores = self.composer_scorer.filter_and_rank(scores)
+            top_scores = self.composer_scorer.filter_and_rank(scores, min_score)
             logger.info(f"Top candidates after ranking: {len(top_scores)}")
             
             # Step 6: Convert to scan results
@@ -77,69 +117,74 @@ class MarketScanner:
             logger.error(f"Error during scan: {e}")
             return []
     
-    async def _fetch_market_data(self, symbols: List[str]) -> List[MarketData]:
-        """Fetch market data for all symbols concurrently"""
-        tasks = []
-        
-        # Batch symbols to avoid overwhelming the API
-        batch_size = 10
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            for symbol in batch:
-                task = self.data_manager.get_market_data(symbol)
-                tasks.append(task)
-            
-            # Small delay between batches
-            if i + batch_size < len(symbols):
-                await asyncio.sleep(0.5)
+    async def _fetch_market_data(self, symbols: List[str],
+                                 max_concurrency: Optional[int] = None) -> List[MarketData]:
+        """Fetch market data for all symbols concurrently
         
-        # Execute all tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        In-flight requests are bounded by max_concurrency, defaulting to
+        config.MAX_CONCURRENT_REQUESTS.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or config.MAX_CONCURRENT_REQUESTS)
         
-        # Filter out None results and exceptions
+        async def fetch(symbol: str) -> Optional[MarketData]:
+            async with semaphore:
+                try:
+                    return await self.data_manager.get_market_data(symbol)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch data for {symbol}: {e}")
+                    return None
+        
+        # Stream results in completion order; None results are skipped silently
         market_data = []
-        for i, result in enumerate(results):
-            if isinstance(result, MarketData):
-                market_data.append(result)
-            elif isinstance(result, Exception):
-                logger.warning(f"Failed to fetch data for {symbols[i % len(symbols)]}: {result}")
-            # None results are skipped silently
+        for next_done in asyncio.as_completed([fetch(symbol) for symbol in symbols]):
+            data = await next_done
+            if data is not None:
+                market_data.append(data)
         
         return market_data
     
     def _apply_basic_filters(self, market_data_list: List[MarketData]) -> List[MarketData]:
         """Apply basic filters before expensive scoring"""
-        filtered = []
+        if not market_data_list:
+            return []
         
-        for data in market_data_list:
-            # Price filters
-            if data.price < config.MIN_PRICE or data.price > config.MAX_PRICE:
-                logger.debug(f"Filtered {data.symbol}: Price ${data.price:.2f} outside range")
-                continue
-            
-            # Volume filter (basic check)
-            if data.volume <= 0:
-                logger.debug(f"Filtered {data.symbol}: No volume")
-                continue
-            
-            # Sanity checks
-            if data.high <= 0 or data.low <= 0 or data.open <= 0:
-                logger.debug(f"Filtered {data.symbol}: Invalid OHLC data")
-                continue
-            
-            # Check for halted/suspended stocks (price == high == low)
-            if data.high == data.low == data.price and data.volume < 1000:
-                logger.debug(f"Filtered {data.symbol}: Appears halted")
-                continue
-            
-            filtered.append(data)
+        cols = np.array(
+            [(d.price, d.volume, d.high, d.low, d.open) for d in market_data_list],
+            dtype=_FILTER_DTYPE
+        )
+        price, volume, high, low = cols["price"], cols["volume"], cols["high"], cols["low"]
+        
+        # Price filters
+        in_range = (price >= MIN_PRICE) & (price <= MAX_PRICE)
+        # Volume filter (basic check)
+        has_volume = volume > 0
+        # Sanity checks
+        valid_ohlc = (high > 0) & (low > 0) & (cols["open"] > 0)
+        # Check for halted/suspended stocks (price == high == low)
+        halted = (high == low) & (low == price) & (volume < 1000)
         
-        return filtered
+        keep = in_range & has_volume & valid_ohlc & ~halted
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for i in np.flatnonzero(~keep):
+                data = market_data_list[i]
+                if not in_range[i]:
+                    reason = f"Price ${data.price:.2f} outside range"
+                elif not has_volume[i]:
+                    reason = "No volume"
+                elif not valid_ohlc[i]:
+                    reason = "Invalid OHLC data"
+                else:
+                    reason = "Appears halted"
+                logger.debug("Filtered %s: %s", data.symbol, reason)
+        
+        return [market_data_list[i] for i in np.flatnonzero(keep)]
     
-    async def quick_scan(self, target_symbols: List[str]) -> List[ScanResult]:
+    async def quick_scan(self, target_symbols: List[str],
+                         max_concurrency: Optional[int] = 16) -> List[ScanResult]:
         """Quick scan of specific symbols (bypass universe)"""
         logger.info(f"Quick scan of {len(target_symbols)} symbols")
-        return await self.run_scan(custom_symbols=target_symbols)
+        return await self.run_scan(custom_symbols=target_symbols, max_concurrency=max_concurrency)
     
     async def continuous_scan(self, interval_minutes: int = 5, max_iterations: int = 100):
         """Run continuous scanning at specified intervals"""
@@ -152,8 +197,8 @@ class MarketScanner:
                 if results:
                     logger.info(f"Continuous scan #{iteration + 1}: Found {len(results)} candidates")
                     for result in results:
-                        logger.info(f"  {result.rank}. {result.symbol} - Score: {result.score:.0f}, "
-                                  f"Target: ${result.target_strike:.2f if result.target_strike else 0:.2f}")
+                        logger.info("  %d. %s - Score: %.0f, Target: $%.2f",
+                                    result.rank, result.symbol, result.score, result.target_strike or 0.0)
                 else:
                     logger.info(f"Continuous scan #{iteration + 1}: No candidates found")
                 
@@ -168,12 +213,17 @@ class MarketScanner:
                 logger.error(f"Error in continuous scan iteration {iteration + 1}: {e}")
                 await asyncio.sleep(30)  # Short delay before retry
     
+    @property
+    def universe_size(self) -> int:
+        """Active universe size, from the TTL-cached symbol list"""
+        return len(self._active_symbols())
+    
     def get_scan_stats(self) -> Dict[str, any]:
         """Get statistics about scanning performance"""
         return {
             "total_scans": self.scan_count,
             "last_scan_time": self.last_scan_time.isoformat() if self.last_scan_time else None,
-            "universe_size": len(self.data_manager.universe.get_active_symbols()),
+            "universe_size": self.universe_size,
             "cache_status": "active" if hasattr(self.data_manager, 'redis_client') else "disabled"
         }
     
@@ -1,6 +1,6 @@
 """Scoring package for composite analysis and benchmarking"""
 
-from composite import CompositeScorer, CompositeScore
+from composite import CompositeScorer, CompositeScore, ScoreBatch
 from benchmark import BTCBenchmark
 
-__all__ = ['CompositeScorer', 'CompositeScore', 'BTCBenchmark']
\ No newline at end of file
+__all__ = ['CompositeScorer', 'CompositeScore', 'ScoreBatch', 'BTCBenchmark']
\ No newline at end of file
@@ -1,146 +1,248 @@
 """BTC benchmarking system - ensures candidates outperform Bitcoin"""
 
 import asyncio
+import os
+import time
 import yfinance as yf
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numpy kernel below
+    njit = None
 
 from config import config
 from utils import logger
 
+# On-disk copy of the last BTC fetch, shared across processes
+BTC_CACHE_DIR = Path.home() / ".cache" / "market-scanner"
+
+# Common timeframes -> periods (hours); anything else is parsed
+_TF_PERIODS = {
+    "20m": 1,  # Less than 1 hour
+    "1h": 1,
+    "2h": 2,
+    "4h": 4,
+    "1d": 24
+}
+
+def _btc_expected(closes: np.ndarray, periods: int, max_exp: float) -> Tuple[float, float, float]:
+    """Expected BTC return from momentum and volatility -> (expected, momentum, vol)"""
+    # Calculate returns
+    returns = np.diff(closes) / closes[:-1]
+    
+    # Calculate recent volatility (sample standard deviation of returns)
+    recent_vol = returns[-periods * 4:].std(ddof=1)
+    
+    # Calculate momentum (recent trend)
+    momentum = returns[-periods:].mean()
+    
+    # Calculate expected return based on momentum and volatility
+    # In trending markets, expect momentum to continue
+    # In volatile markets, expect larger moves
+    
+    base_expectation = momentum * periods  # Scale momentum to timeframe
+    volatility_expectation = recent_vol * np.sqrt(periods)  # Scale volatility to timeframe
+    
+    # Conservative approach: use lower of momentum or volatility expectation
+    expected_return = min(abs(base_expectation), volatility_expectation)
+    
+    # Apply directional bias if momentum is strong
+    if abs(momentum) > recent_vol * 0.5:  # Strong momentum
+        expected_return = abs(base_expectation)
+    
+    # Minimum expectation (market typically moves)
+    expected_return = max(expected_return, 0.01)  # At least 1%
+    
+    # Maximum reasonable expectation for timeframe
+    expected_return = min(expected_return, max_exp)
+    
+    return expected_return, momentum, recent_vol
+
+if njit is not None:
+    @njit(cache=True)
+    def _btc_expected(closes, periods, max_exp):
+        """Compiled loop version of the numpy kernel above"""
+        n_returns = len(closes) - 1
+        vol_start = max(n_returns - periods * 4, 0)
+        mom_start = max(n_returns - periods, 0)
+        vol_n = n_returns - vol_start
+        
+        # Window sums for volatility mean and momentum
+        vol_sum = 0.0
+        mom_sum = 0.0
+        for i in range(vol_start, n_returns):
+            r = (closes[i + 1] - closes[i]) / closes[i]
+            vol_sum += r
+            if i >= mom_start:
+                mom_sum += r
+        momentum = mom_sum / (n_returns - mom_start)
+        
+        # Sample standard deviation (second pass for accuracy)
+        recent_vol = np.nan
+        if vol_n > 1:
+            vol_mean = vol_sum / vol_n
+            sq_dev = 0.0
+            for i in range(vol_start, n_returns):
+                d = (closes[i + 1] - closes[i]) / closes[i] - vol_mean
+                sq_dev += d * d
+            recent_vol = np.sqrt(sq_dev / (vol_n - 1))
+        
+        base_expectation = abs(momentum * periods)
+        expected_return = min(base_expectation, recent_vol * np.sqrt(periods))
+        if abs(momentum) > recent_vol * 0.5:
+            expected_return = base_expectation
+        expected_return = min(max(expected_return, 0.01), max_exp)
+        
+        return expected_return, momentum, recent_vol
+
+def _download_closes() -> Optional[np.ndarray]:
+    """Last 7 days of hourly BTC closes from yfinance (blocking)"""
+    try:
+        btc = yf.Ticker(config.BTC_SYMBOL)
+        
+        # Get 7 days of hourly data
+        hist = btc.history(period="7d", interval="1h")
+        
+        if hist.empty:
+            logger.warning("No BTC data available")
+            return None
+        
+        return hist["Close"].to_numpy(dtype=np.float64)
+        
+    except Exception as e:
+        logger.error(f"Error fetching BTC data: {e}")
+        return None
+
+def _load_closes(cache_file: Path, max_age: float) -> Optional[np.ndarray]:
+    """Closes from the disk cache if younger than max_age seconds"""
+    try:
+        if time.time() - cache_file.stat().st_mtime < max_age:
+            return np.load(cache_file)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable - fetch fresh
+    return None
+
+def _save_closes(cache_file: Path, closes: np.ndarray):
+    """Atomically replace the disk cache with closes"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            np.save(f, closes)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Could not write BTC cache: %s", e)
+
 class BTCBenchmark:
     """Handles Bitcoin benchmarking for candidate comparison"""
     
     def __init__(self):
-        self.cache = {}
+        self.cache = {}  # key -> (monotonic expiry, value)
         self.cache_duration = 300  # 5 minutes
+        self._fetch_lock = asyncio.Lock()
+    
+    def _cached(self, cache_key: str) -> Optional[float]:
+        """Unexpired cached value, or None"""
+        entry = self.cache.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
     
     async def get_expected_return(self, timeframe: str = "1h") -> float:
         """Get expected BTC return for the given timeframe"""
         cache_key = f"btc_return_{timeframe}"
         
         # Check cache
-        if cache_key in self.cache:
-            cached_time, cached_value = self.cache[cache_key]
-            if (datetime.now() - cached_time).seconds < self.cache_duration:
-                return cached_value
+        cached_value = self._cached(cache_key)
+        if cached_value is not None:
+            return cached_value
         
-        try:
-            # Get BTC data
-            btc_data = await self._fetch_btc_data()
-            if not btc_data:
-                return 0.02  # Default 2% expectation if data unavailable
-            
-            # Calculate expected return based on timeframe
-            expected_return = self._calculate_expected_return(btc_data, timeframe)
-            
-            # Cache the result
-            self.cache[cache_key] = (datetime.now(), expected_return)
-            
-            return expected_return
+        # Concurrent misses wait for a single fetch
+        async with self._fetch_lock:
+            cached_value = self._cached(cache_key)
+            if cached_value is not None:
+                return cached_value
             
-        except Exception as e:
-            logger.error(f"Error calculating BTC benchmark: {e}")
-            return 0.02  # Conservative default
+            try:
+                # Get BTC closes
+                closes = await self._fetch_btc_data()
+                if closes is None:
+                    return 0.02  # Default 2% expectation if data unavailable
+                
+                # Calculate expected return based on timeframe
+                expected_return = self._calculate_expected_return(closes, timeframe)
+                
+                # Cache the result
+                self.cache[cache_key] = (time.monotonic() + self.cache_duration, expected_return)
+                
+                return expected_return
+                
+            except Exception as e:
+                logger.error(f"Error calculating BTC benchmark: {e}")
+                return 0.02  # Conservative default
     
-    async def _fetch_btc_data(self) -> Optional[pd.DataFrame]:
-        """Fetch recent BTC price data"""
-        try:
-            btc = yf.Ticker(config.BTC_SYMBOL)
-            
-            # Get 7 days of hourly data
-            hist = btc.history(period="7d", interval="1h")
-            
-            if hist.empty:
-                logger.warning("No BTC data available")
-                return None
-            
-            return hist
-            
-        except Exception as e:
-            logger.error(f"Error fetching BTC data: {e}")
-            return None
+    async def _fetch_btc_data(self) -> Optional[np.ndarray]:
+        """Fetch recent BTC hourly closes as a float64 array
+        
+        Closes are also kept on disk so a fresh process within cache_duration
+        skips the yfinance call. The download and disk I/O run in the default
+        executor, off the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        cache_file = BTC_CACHE_DIR / f"{config.BTC_SYMBOL}_7d_1h.npy"
+        closes = await loop.run_in_executor(None, _load_closes, cache_file, self.cache_duration)
+        if closes is not None:
+            return closes
+        
+        closes = await loop.run_in_executor(None, _download_closes)
+        if closes is not None:
+            await loop.run_in_executor(None, _save_closes, cache_file, closes)
+        return closes
     
-    def _calculate_expected_return(self, btc_data: pd.DataFrame, timeframe: str) -> float:
+    def _calculate_expected_return(self, closes: np.ndarray, timeframe: str) -> float:
         """Calculate expected BTC return based on historical volatility and momentum"""
         
-        # Calculate returns
-        btc_data['returns'] = btc_data['Close'].pct_change()
-        
         # Get timeframe-specific parameters
         periods = self._get_periods_for_timeframe(timeframe)
         
-        if len(btc_data) < periods * 2:
+        if len(closes) < periods * 2:
             return 0.02  # Default if insufficient data
         
-        # Calculate recent volatility (standard deviation of returns)
-        recent_vol = btc_data['returns'].tail(periods * 4).std()
-        
-        # Calculate momentum (recent trend)
-        recent_returns = btc_data['returns'].tail(periods)
-        momentum = recent_returns.mean()
-        
-        # Calculate expected return based on momentum and volatility
-        # In trending markets, expect momentum to continue
-        # In volatile markets, expect larger moves
-        
-        base_expectation = momentum * periods  # Scale momentum to timeframe
-        volatility_expectation = recent_vol * np.sqrt(periods)  # Scale volatility to timeframe
-        
-        # Conservative approach: use lower of momentum or volatility expectation
-        expected_return = min(abs(base_expectation), volatility_expectation)
-        
-        # Apply directional bias if momentum is strong
-        if abs(momentum) > recent_vol * 0.5:  # Strong momentum
-            expected_return = abs(base_expectation)
-        
-        # Minimum expectation (market typically moves)
-        expected_return = max(expected_return, 0.01)  # At least 1%
-        
-        # Maximum reasonable expectation for timeframe
         max_expectation = self._get_max_expectation_for_timeframe(timeframe)
-        expected_return = min(expected_return, max_expectation)
+        expected_return, momentum, recent_vol = _btc_expected(closes, periods, max_expectation)
         
-        logger.debug(f"BTC {timeframe} expected return: {expected_return:.3f} "
-                    f"(momentum: {momentum:.4f}, vol: {recent_vol:.4f})")
+        logger.debug("BTC %s expected return: %.3f (momentum: %.4f, vol: %.4f)",
+                     timeframe, expected_return, momentum, recent_vol)
         
         return expected_return
     
-    def _get_periods_for_timeframe(self, timeframe: str) -> int:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_periods_for_timeframe(timeframe: str) -> int:
         """Get number of periods (hours) for the given timeframe"""
-        timeframe_map = {
-            "20m": 1,  # Less than 1 hour
-            "1h": 1,
-            "2h": 2,
-            "4h": 4,
-            "1d": 24
-        }
+        periods = _TF_PERIODS.get(timeframe)
+        if periods is not None:
+            return periods
         
         # Extract number and unit from timeframe string
         if "h" in timeframe:
-            hours = int(timeframe.replace("h", ""))
-            return hours
+            return int(timeframe.replace("h", ""))
         elif "m" in timeframe:
             return 1  # Minutes mapped to 1 hour
         elif "d" in timeframe:
-            days = int(timeframe.replace("d", ""))
-            return days * 24
+            return int(timeframe.replace("d", "")) * 24
         else:
-            return timeframe_map.get(timeframe, 1)
+            return 1
     
-    def _get_max_expectation_for_timeframe(self, timeframe: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_max_expectation_for_timeframe(timeframe: str) -> float:
         """Get maximum reasonable expectation for timeframe"""
-        max_expectations = {
-            "20m": 0.03,   # 3% max in 20 minutes
-            "1h": 0.05,    # 5% max in 1 hour
-            "2h": 0.08,    # 8% max in 2 hours
-            "4h": 0.12,    # 12% max in 4 hours
-            "1d": 0.20     # 20% max in 1 day
-        }
-        
-        periods = self._get_periods_for_timeframe(timeframe)
+        periods = BTCBenchmark._get_periods_for_timeframe(timeframe)
         
         if periods <= 1:
             return 0.05
@@ -170,11 +272,9 @@ class BTCBenchmark:
         """Get human-readable benchmark summary"""
         try:
             # Use cached value if available
-            cache_key = f"btc_return_{timeframe}"
-            if cache_key in self.cache:
-                cached_time, btc_return = self.cache[cache_key]
-                if (datetime.now() - cached_time).seconds < self.cache_duration:
-                    return f"BTC {timeframe} benchmark: {btc_return:.1%}"
+            btc_return = self._cached(f"btc_return_{timeframe}")
+            if btc_return is not None:
+                return f"BTC {timeframe} benchmark: {btc_return:.1%}"
             
             return f"BTC {timeframe} benchmark: fetching..."
             
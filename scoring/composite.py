@@ -1,17 +1,63 @@
 """Composite scoring algorithm - combines all signals and benchmarks against BTC"""
 
 import asyncio
+import logging
+import os
+import sys
 import numpy as np
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from operator import attrgetter
 
 from utils import MarketData, ScanResult, logger
 from signals import IgnitionEngine, PressureEngine, FuelEngine, IgnitionSignal, PressureSignal, FuelSignal
 from config import config
 from benchmark import BTCBenchmark
 
-@dataclass
+# Bonus indexed by how many engines scored above 70
+_CONFIRMATION_BONUS = (0.0, 0.0, 8.0, 15.0)
+
+# Probability bounds -> estimated timeframe label
+_TF_BOUNDS = (0.6, 0.7, 0.8)
+_TF_LABELS = ("4+ hours", "2-4 hours", "1-2 hours", "20-60 minutes")
+
+# (CompositeScore field, threshold, label) for _identify_squeeze_factors
+_SQUEEZE_FACTORS = (
+    ("ignition_score", 70, "momentum_ignition"),
+    ("pressure_score", 70, "options_pressure"),
+    ("fuel_score", 70, "squeeze_fuel"),
+    ("probability_reach", 0.8, "high_probability"),
+    ("expected_return", 0.15, "high_return_potential"),
+)
+
+# Columns pulled from CompositeScore for vectorised filter_and_rank, in _RANK_DTYPE order
+_RANK_GET = attrgetter("total_score", "probability_reach", "risk_reward_ratio", "btc_benchmark_passed")
+_RANK_DTYPE = np.dtype([
+    ("tot", "f8"),
+    ("prob", "f8"),
+    ("rr", "f8"),
+    ("btc", "?")
+])
+
+def _estimate_moves(rel_vol: np.ndarray, high: np.ndarray, low: np.ndarray,
+                    price: np.ndarray, squeeze: np.ndarray) -> np.ndarray:
+    """CompositeScorer._estimate_price_move over arrays for a whole batch"""
+    # 5% base expectation, scaled by volume factor
+    move = 0.05 * np.select([rel_vol > 3, rel_vol > 2], [1.5, 1.2], 1.0)
+    
+    # Volatility factor (estimated from price range)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        daily_range = (high - low) / price
+    move = np.where((high > 0) & (low > 0) & (daily_range > 0.15), move * 1.3, move)
+    
+    # Squeeze fuel factor
+    move = move * np.select([squeeze > 80, squeeze > 60], [2.0, 1.5], 1.0)
+    
+    return np.minimum(move, 0.50)  # Cap at 50% expected move
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class CompositeScore:
     symbol: str
     total_score: float
@@ -25,6 +71,18 @@ class CompositeScore:
     target_price: Optional[float]
     risk_reward_ratio: float
     
+class ScoreBatch(list):
+    """CompositeScores from one score_multiple_symbols call
+    
+    Behaves as a List[CompositeScore]; columns holds the _RANK_DTYPE
+    filter/rank fields row-aligned with the list, so filter_and_rank can
+    work on the arrays without touching each score object again.
+    """
+    
+    def __init__(self, scores: List[CompositeScore], columns: np.ndarray):
+        super().__init__(scores)
+        self.columns = columns
+
 class CompositeScorer:
     """Combines all signal engines and calculates final scores"""
     
@@ -33,95 +91,129 @@ class CompositeScorer:
         self.pressure_engine = PressureEngine()
         self.fuel_engine = FuelEngine()
         self.btc_benchmark = BTCBenchmark()
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="scoring")
+        
+        # Engine weights as fractions (config holds percentages)
+        self._w = (
+            config.VWAP_MOMENTUM_WEIGHT * 0.01,
+            config.OPTIONS_PRESSURE_WEIGHT * 0.01,
+            config.VOLUME_WEIGHT * 0.01
+        )
+        
+        # filter_and_rank thresholds (config is frozen)
+        self._min_score = config.MIN_SCORE_THRESHOLD
+        self._min_prob = config.MIN_PROBABILITY_THRESHOLD
+        self._max_out = config.MAX_SYMBOLS_PER_SCAN
+    
+    def close(self):
+        """Shut down the scoring thread pool"""
+        self._executor.shutdown()
         
     async def score_symbol(self, market_data: MarketData, 
-                          timeframe: str = "1h") -> Optional[CompositeScore]:
-        """Score a single symbol using all engines"""
+                          timeframe: str = "1h",
+                          btc_return: Optional[float] = None) -> Optional[CompositeScore]:
+        """Score a single symbol using all engines
+        
+        Pass btc_return when it is already known for the timeframe to skip
+        the benchmark lookup.
+        """
+        loop = asyncio.get_running_loop()
+        engines = (self.ignition_engine, self.pressure_engine, self.fuel_engine)
+        
+        # Engines run side by side on the scoring pool, overlapping the BTC lookup
+        pending = [loop.run_in_executor(self._executor, engine.analyze, market_data) for engine in engines]
+        if btc_return is None:
+            pending.append(self.btc_benchmark.get_expected_return(timeframe))
+        
         try:
-            # Run all signal engines
-            ignition_signal = self.ignition_engine.analyze(market_data)
-            pressure_signal = self.pressure_engine.analyze(market_data)
-            fuel_signal = self.fuel_engine.analyze(market_data)
+            results = await asyncio.gather(*pending)
+            signals = tuple(results[:3])
+            if btc_return is None:
+                btc_return = results[3]
             
             # Calculate weighted composite score
-            total_score = self._calculate_weighted_score(
-                ignition_signal, pressure_signal, fuel_signal
-            )
-            
-            # Calculate expected return and target price
-            expected_return, target_price = self._calculate_expected_return(
-                market_data, pressure_signal, fuel_signal
-            )
+            total_score = self._calculate_weighted_score(*signals)
             
-            # Get BTC benchmark
-            btc_return = await self.btc_benchmark.get_expected_return(timeframe)
-            btc_passed = expected_return > btc_return
-            
-            # Calculate risk/reward ratio
-            risk_reward = self._calculate_risk_reward(
-                market_data.price, target_price, expected_return
-            )
-            
-            return CompositeScore(
-                symbol=market_data.symbol,
-                total_score=total_score,
-                ignition_score=ignition_signal.score,
-                pressure_score=pressure_signal.score,
-                fuel_score=fuel_signal.score,
-                btc_benchmark_passed=btc_passed,
-                expected_return=expected_return,
-                btc_expected_return=btc_return,
-                probability_reach=pressure_signal.probability_reach,
-                target_price=target_price,
-                risk_reward_ratio=risk_reward
-            )
+            return self._build_score(market_data, signals, total_score, btc_return)
             
         except Exception as e:
             logger.error(f"Error scoring symbol {market_data.symbol}: {e}")
             return None
     
+    def _analyze_batch(self, symbols_data: List[MarketData]) -> Tuple[List[IgnitionSignal], List[FuelSignal]]:
+        """Ignition and fuel for the whole batch in one pass (pressure stays per symbol)"""
+        return (
+            self.ignition_engine.analyze_batch(symbols_data),
+            self.fuel_engine.analyze_batch(symbols_data)
+        )
+    
+    def _analyze_symbol(self, market_data: MarketData) -> Tuple[IgnitionSignal, FuelSignal]:
+        """Per-symbol ignition and fuel, used when the batch pass fails"""
+        return self.ignition_engine.analyze(market_data), self.fuel_engine.analyze(market_data)
+    
+    def _build_score(self, market_data: MarketData,
+                     signals: Tuple[IgnitionSignal, PressureSignal, FuelSignal],
+                     total_score: float, btc_return: float,
+                     estimated_move: Optional[float] = None) -> CompositeScore:
+        """Expected return, BTC check and risk/reward around an already computed total score"""
+        ignition_signal, pressure_signal, fuel_signal = signals
+        
+        # Calculate expected return and target price
+        expected_return, target_price = self._calculate_expected_return(
+            market_data, pressure_signal, fuel_signal, estimated_move
+        )
+        
+        btc_passed = expected_return > btc_return
+        
+        # Calculate risk/reward ratio
+        risk_reward = self._calculate_risk_reward(
+            market_data.price, target_price, expected_return
+        )
+        
+        return CompositeScore(
+            symbol=market_data.symbol,
+            total_score=total_score,
+            ignition_score=ignition_signal.score,
+            pressure_score=pressure_signal.score,
+            fuel_score=fuel_signal.score,
+            btc_benchmark_passed=btc_passed,
+            expected_return=expected_return,
+            btc_expected_return=btc_return,
+            probability_reach=pressure_signal.probability_reach,
+            target_price=target_price,
+            risk_reward_ratio=risk_reward
+        )
+    
     def _calculate_weighted_score(self, ignition: IgnitionSignal, 
                                 pressure: PressureSignal, fuel: FuelSignal) -> float:
         """Calculate weighted composite score from all signals"""
         
         # Apply configured weights
-        weighted_score = (
-            ignition.score * (config.VWAP_MOMENTUM_WEIGHT / 100) +
-            pressure.score * (config.OPTIONS_PRESSURE_WEIGHT / 100) +
-            fuel.score * (config.VOLUME_WEIGHT / 100) +
-            # Additional timing and float weights are embedded in the signals
-            0  # Placeholder for additional factors
-        )
+        # Additional timing and float weights are embedded in the signals
+        w_ignition, w_pressure, w_fuel = self._w
+        weighted_score = ignition.score * w_ignition + pressure.score * w_pressure + fuel.score * w_fuel
         
         # Apply bonuses for signal combinations
         bonus = self._calculate_combination_bonus(ignition, pressure, fuel)
         
         final_score = min(100, weighted_score + bonus)
         
-        logger.debug(f"Weighted score: {weighted_score:.1f}, bonus: {bonus:.1f}, final: {final_score:.1f}")
+        logger.debug("Weighted score: %.1f, bonus: %.1f, final: %.1f", weighted_score, bonus, final_score)
         
         return final_score
     
     def _calculate_combination_bonus(self, ignition: IgnitionSignal,
                                    pressure: PressureSignal, fuel: FuelSignal) -> float:
         """Calculate bonus points for favorable signal combinations"""
+        # Triple (15) / double (8) confirmation bonus by number of strong signals
+        strong_signals = (ignition.score > 70) + (pressure.score > 70) + (fuel.score > 70)
+        return _CONFIRMATION_BONUS[strong_signals] + self._pattern_bonus(ignition, pressure, fuel)
+    
+    @staticmethod
+    def _pattern_bonus(ignition: IgnitionSignal, pressure: PressureSignal, fuel: FuelSignal) -> float:
+        """Specific combination bonuses"""
         bonus = 0.0
         
-        # Triple confirmation bonus
-        strong_signals = 0
-        if ignition.score > 70:
-            strong_signals += 1
-        if pressure.score > 70:
-            strong_signals += 1
-        if fuel.score > 70:
-            strong_signals += 1
-        
-        if strong_signals >= 3:
-            bonus += 15  # Triple confirmation
-        elif strong_signals >= 2:
-            bonus += 8   # Double confirmation
-        
-        # Specific combination bonuses
         if ignition.vwap_momentum and pressure.probability_reach > 0.7:
             bonus += 5  # Momentum + high probability
         
@@ -133,9 +225,22 @@ class CompositeScorer:
         
         return bonus
     
+    def _weighted_scores_batch(self, ig: np.ndarray, pr: np.ndarray, fu: np.ndarray,
+                               pattern_bonus: np.ndarray) -> np.ndarray:
+        """_calculate_weighted_score over arrays of engine scores for a whole batch"""
+        w_ignition, w_pressure, w_fuel = self._w
+        strong_signals = (ig > 70).astype(np.int8) + (pr > 70) + (fu > 70)
+        bonus = np.take(_CONFIRMATION_BONUS, strong_signals) + pattern_bonus
+        return np.minimum(ig * w_ignition + pr * w_pressure + fu * w_fuel + bonus, 100)
+    
     def _calculate_expected_return(self, market_data: MarketData,
-                                 pressure: PressureSignal, fuel: FuelSignal) -> Tuple[float, Optional[float]]:
-        """Calculate expected return and target price"""
+                                 pressure: PressureSignal, fuel: FuelSignal,
+                                 estimated_move: Optional[float] = None) -> Tuple[float, Optional[float]]:
+        """Calculate expected return and target price
+        
+        estimated_move, when given, is a precomputed _estimate_price_move
+        result (batch scoring).
+        """
         current_price = market_data.price
         
         # Use options target if available
@@ -144,7 +249,8 @@ class CompositeScorer:
             basic_return = (target_price - current_price) / current_price
         else:
             # Estimate based on volatility and signals
-            estimated_move = self._estimate_price_move(market_data, fuel)
+            if estimated_move is None:
+                estimated_move = self._estimate_price_move(market_data, fuel)
             target_price = current_price * (1 + estimated_move)
             basic_return = estimated_move
         
@@ -199,68 +305,127 @@ class CompositeScorer:
         return potential_gain / potential_loss
     
     async def score_multiple_symbols(self, symbols_data: List[MarketData],
-                                   timeframe: str = "1h") -> List[CompositeScore]:
-        """Score multiple symbols concurrently"""
-        tasks = [
-            self.score_symbol(market_data, timeframe)
+                                   timeframe: str = "1h") -> "ScoreBatch":
+        """Score multiple symbols on the scoring thread pool
+        
+        The BTC benchmark is fetched once for the batch; the engines are
+        synchronous, so they run in executor threads instead of as
+        coroutines on the event loop - pressure per symbol, ignition and
+        fuel together as one vectorised batch. Weighted scores for the batch
+        are then computed in one numpy pass.
+        """
+        btc_return = await self.btc_benchmark.get_expected_return(timeframe)
+        
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(self._executor, self.pressure_engine.analyze, market_data)
             for market_data in symbols_data
         ]
+        futures.append(loop.run_in_executor(self._executor, self._analyze_batch, symbols_data))
+        
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        batch = results.pop()
+        if isinstance(batch, Exception):
+            logger.error(f"Error in batch ignition/fuel analysis, falling back to per-symbol: {batch}")
+            engine_signals = await asyncio.gather(*(
+                loop.run_in_executor(self._executor, self._analyze_symbol, market_data)
+                for market_data in symbols_data
+            ), return_exceptions=True)
+        else:
+            engine_signals = zip(*batch)
+        
+        # Drop symbols whose engines failed
+        analyzed = []
+        for market_data, pressure_signal, signals in zip(symbols_data, results, engine_signals):
+            error = next((r for r in (pressure_signal, signals) if isinstance(r, Exception)), None)
+            if error is not None:
+                logger.error(f"Error scoring symbol {market_data.symbol}: {error}")
+            else:
+                ignition_signal, fuel_signal = signals
+                analyzed.append((market_data, (ignition_signal, pressure_signal, fuel_signal)))
+        
+        if not analyzed:
+            return ScoreBatch([], np.empty(0, dtype=_RANK_DTYPE))
+        
+        ig = np.array([signals[0].score for _, signals in analyzed], dtype=np.float64)
+        pr = np.array([signals[1].score for _, signals in analyzed], dtype=np.float64)
+        fu = np.array([signals[2].score for _, signals in analyzed], dtype=np.float64)
+        pattern_bonus = np.array([self._pattern_bonus(*signals) for _, signals in analyzed], dtype=np.float64)
+        totals = self._weighted_scores_batch(ig, pr, fu, pattern_bonus)
+        
+        estimated_moves = _estimate_moves(
+            np.array([signals[2].relative_volume for _, signals in analyzed], dtype=np.float64),
+            np.array([md.high for md, _ in analyzed], dtype=np.float64),
+            np.array([md.low for md, _ in analyzed], dtype=np.float64),
+            np.array([md.price for md, _ in analyzed], dtype=np.float64),
+            np.array([signals[2].short_squeeze_score for _, signals in analyzed], dtype=np.float64)
+        ).tolist()
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out None results and exceptions
         valid_scores = []
-        for result in results:
-            if isinstance(result, CompositeScore):
-                valid_scores.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Error in concurrent scoring: {result}")
-        
-        return valid_scores
+        kept = []
+        for i, ((market_data, signals), total_score, move) in enumerate(zip(analyzed, totals.tolist(), estimated_moves)):
+            try:
+                valid_scores.append(self._build_score(market_data, signals, total_score, btc_return, move))
+                kept.append(i)
+            except Exception as e:
+                logger.error(f"Error scoring symbol {market_data.symbol}: {e}")
+        
+        # Ranking columns, filled from the batch arrays rather than re-read from the scores
+        columns = np.empty(len(valid_scores), dtype=_RANK_DTYPE)
+        columns["tot"] = totals[kept]
+        columns["prob"] = [score.probability_reach for score in valid_scores]
+        columns["rr"] = [score.risk_reward_ratio for score in valid_scores]
+        columns["btc"] = [score.btc_benchmark_passed for score in valid_scores]
+        
+        return ScoreBatch(valid_scores, columns)
     
-    def filter_and_rank(self, scores: List[CompositeScore]) -> List[CompositeScore]:
+    def filter_and_rank(self, scores: List[CompositeScore],
+                        min_score: Optional[float] = None) -> List[CompositeScore]:
         """Filter scores and rank by composite criteria"""
-        # Apply filters
-        filtered = []
-        for score in scores:
-            # Must pass BTC benchmark
-            if not score.btc_benchmark_passed:
-                logger.debug(f"Filtered {score.symbol}: Failed BTC benchmark")
-                continue
-                
-            # Minimum score threshold
-            if score.total_score < config.MIN_SCORE_THRESHOLD:
-                logger.debug(f"Filtered {score.symbol}: Score {score.total_score} below threshold")
-                continue
-                
-            # Minimum probability
-            if score.probability_reach < config.MIN_PROBABILITY_THRESHOLD:
-                logger.debug(f"Filtered {score.symbol}: Probability {score.probability_reach} too low")
-                continue
-            
-            filtered.append(score)
-        
-        # Rank by composite score with probability weighting
-        def ranking_key(score: CompositeScore) -> float:
-            return (
-                score.total_score * 0.7 +  # 70% weight on total score
-                score.probability_reach * 30 +  # 30% weight on probability (scaled to 0-30)
-                score.risk_reward_ratio * 5  # Small bonus for good risk/reward
-            )
-        
-        ranked = sorted(filtered, key=ranking_key, reverse=True)
-        
-        # Return top candidates
-        return ranked[:config.MAX_SYMBOLS_PER_SCAN]
+        if not scores:
+            return []
+        
+        effective_min = self._min_score if min_score is None else min_score
+        arr = scores.columns if isinstance(scores, ScoreBatch) else self._to_arrays(scores)
+        
+        # Must pass BTC benchmark, minimum score threshold and minimum probability
+        passed_btc = arr["btc"]
+        above_min = arr["tot"] >= effective_min
+        probable = arr["prob"] >= self._min_prob
+        mask = passed_btc & above_min & probable
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for i in np.flatnonzero(~mask):
+                score = scores[i]
+                if not passed_btc[i]:
+                    logger.debug("Filtered %s: Failed BTC benchmark", score.symbol)
+                elif not above_min[i]:
+                    logger.debug("Filtered %s: Score %s below threshold", score.symbol, score.total_score)
+                else:
+                    logger.debug("Filtered %s: Probability %s too low", score.symbol, score.probability_reach)
+        
+        # Rank by composite score with probability weighting:
+        # 70% weight on total score, probability scaled to 0-30, small bonus for good risk/reward
+        rank_vec = arr["tot"] * 0.7 + arr["prob"] * 30 + arr["rr"] * 5
+        
+        # Top candidates only - stable, so ties keep their input order (as sorted() did)
+        idx = np.flatnonzero(mask)
+        idx = idx[np.argsort(-rank_vec[idx], kind="stable")][:self._max_out]
+        
+        return [scores[i] for i in idx]
+    
+    @staticmethod
+    def _to_arrays(scores: List[CompositeScore]) -> np.ndarray:
+        """Structured array of the fields used for filtering and ranking"""
+        return np.array(list(map(_RANK_GET, scores)), dtype=_RANK_DTYPE)
     
     def create_scan_results(self, scores: List[CompositeScore], 
                           market_data_dict: Dict[str, MarketData]) -> List[ScanResult]:
         """Convert composite scores to scan results"""
         results = []
+        market_datas = [market_data_dict[score.symbol] for score in scores]
         
-        for i, score in enumerate(scores):
-            market_data = market_data_dict[score.symbol]
-            
+        for rank, (score, market_data) in enumerate(zip(scores, market_datas), 1):
             # Calculate entry zone (±1% around current price)
             entry_low = market_data.price * 0.99
             entry_high = market_data.price * 1.01
@@ -279,7 +444,7 @@ class CompositeScorer:
             
             result = ScanResult(
                 symbol=score.symbol,
-                rank=i + 1,
+                rank=rank,
                 score=score.total_score,
                 current_price=market_data.price,
                 vwap=market_data.vwap,
@@ -287,7 +452,8 @@ class CompositeScorer:
                 probability_reach=score.probability_reach,
                 expected_return=score.expected_return,
                 timeframe=timeframe,
-                entry_zone=(entry_low, entry_high),
+                entry_low=entry_low,
+                entry_high=entry_high,
                 stop_loss=stop_loss,
                 squeeze_factors=squeeze_factors,
                 reasoning=reasoning
@@ -299,54 +465,30 @@ class CompositeScorer:
     
     def _estimate_timeframe(self, probability: float) -> str:
         """Estimate timeframe based on probability"""
-        if probability > 0.8:
-            return "20-60 minutes"
-        elif probability > 0.7:
-            return "1-2 hours"  
-        elif probability > 0.6:
-            return "2-4 hours"
-        else:
-            return "4+ hours"
+        # bisect_left counts bounds strictly below probability (thresholds are exclusive)
+        return _TF_LABELS[bisect_left(_TF_BOUNDS, probability)]
     
     def _generate_reasoning(self, score: CompositeScore, market_data: MarketData) -> str:
         """Generate human-readable reasoning for the score"""
-        reasons = []
-        
-        reasons.append(f"Score: {score.total_score:.0f}/100")
+        reasons = [f"Score: {score.total_score:.0f}/100"]
+        add = reasons.append
         
         if score.expected_return > 0.1:
-            reasons.append(f"Expected return: {score.expected_return:.1%}")
+            add(f"Expected return: {score.expected_return:.1%}")
         
         if score.target_price:
-            reasons.append(f"Target: ${score.target_price:.2f}")
+            add(f"Target: ${score.target_price:.2f}")
         
-        reasons.append(f"vs BTC: {score.expected_return:.1%} vs {score.btc_expected_return:.1%}")
+        add(f"vs BTC: {score.expected_return:.1%} vs {score.btc_expected_return:.1%}")
         
         if score.probability_reach > 0.7:
-            reasons.append(f"High probability: {score.probability_reach:.1%}")
+            add(f"High probability: {score.probability_reach:.1%}")
         
         if score.risk_reward_ratio > 3:
-            reasons.append(f"Good R/R: {score.risk_reward_ratio:.1f}:1")
+            add(f"Good R/R: {score.risk_reward_ratio:.1f}:1")
         
         return "; ".join(reasons)
     
     def _identify_squeeze_factors(self, score: CompositeScore) -> List[str]:
         """Identify squeeze factors from the score"""
-        factors = []
-        
-        if score.ignition_score > 70:
-            factors.append("momentum_ignition")
-        
-        if score.pressure_score > 70:
-            factors.append("options_pressure")
-        
-        if score.fuel_score > 70:
-            factors.append("squeeze_fuel")
-        
-        if score.probability_reach > 0.8:
-            factors.append("high_probability")
-        
-        if score.expected_return > 0.15:
-            factors.append("high_return_potential")
-        
-        return factors
\ No newline at end of file
+        return [label for field, threshold, label in _SQUEEZE_FACTORS if getattr(score, field) > threshold]
@@ -7,19 +7,24 @@ import os
 import sys
 import subprocess
 import shutil
+import zipfile
 from pathlib import Path
 
 def run_command(cmd, cwd=None):
     """Run shell command and handle errors"""
     print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
     
-    if result.returncode != 0:
-        print(f"Error: {result.stderr}")
+    # Stream output as it arrives (PyInstaller runs for minutes)
+    with subprocess.Popen(cmd, shell=True, cwd=cwd, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+    
+    if proc.returncode != 0:
+        print(f"Error: command failed with code {proc.returncode}")
         sys.exit(1)
     
-    print(result.stdout)
-    return result
+    return proc
 
 def build_binary():
     """Build macOS binary using PyInstaller"""
@@ -57,7 +62,7 @@ def build_binary():
         
         # Test binary
         print("\n🧪 Testing binary...")
-        result = run_command(f"{binary_path} version")
+        run_command(f"{binary_path} version")
         
         print("✅ Binary build successful!")
         print(f"📦 Location: {binary_path}")
@@ -126,14 +131,13 @@ echo "🤖 For Claude integration, see: claude_integration.md"
     archive_name = "market-scanner-macos"
     print(f"\n📦 Creating archive: {archive_name}.zip")
     
-    shutil.make_archive(
-        dist_dir / archive_name,
-        'zip',
-        dist_dir,
-        'market-scanner-macos'
-    )
-    
+    # Fast deflate level - the PyInstaller binary is already compressed
     archive_path = dist_dir / f"{archive_name}.zip"
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        archive.write(package_dir, package_dir.relative_to(dist_dir))
+        for path in sorted(package_dir.rglob("*")):
+            archive.write(path, path.relative_to(dist_dir))
+    
     print(f"✅ Distribution created: {archive_path}")
     print(f"📊 Archive size: {archive_path.stat().st_size / 1024 / 1024:.1f} MB")
     
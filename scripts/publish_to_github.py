@@ -7,6 +7,7 @@ import os
 import sys
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def run_command(cmd, cwd=None, capture=True):
@@ -14,12 +15,14 @@ def run_command(cmd, cwd=None, capture=True):
     print(f"Running: {cmd}")
     
     if capture:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}")
+        # Stream combined output line by line instead of buffering it
+        with subprocess.Popen(cmd, shell=True, cwd=cwd, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+        if proc.returncode != 0:
+            print(f"Error: command failed with code {proc.returncode}")
             return False
-        if result.stdout.strip():
-            print(result.stdout)
     else:
         result = subprocess.run(cmd, shell=True, cwd=cwd)
         if result.returncode != 0:
@@ -38,6 +41,11 @@ def check_gh_cli_installed():
     result = subprocess.run("gh --version", shell=True, capture_output=True, text=True)
     return result.returncode == 0
 
+def check_gh_authenticated():
+    """Check if user is logged into GitHub CLI"""
+    result = subprocess.run("gh auth status", shell=True, capture_output=True, text=True)
+    return result.returncode == 0
+
 def initialize_git_repo():
     """Initialize git repository"""
     project_root = Path(__file__).parent.parent
@@ -193,20 +201,23 @@ def main():
     print("🚀 Market Scanner GitHub Publisher")
     print("=" * 50)
     
-    # Pre-flight checks
-    if not check_git_installed():
+    # Pre-flight checks - independent subprocesses, run side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        git_check = executor.submit(check_git_installed)
+        gh_check = executor.submit(check_gh_cli_installed)
+        auth_check = executor.submit(check_gh_authenticated)
+    
+    if not git_check.result():
         print("❌ Git is not installed. Please install Git first.")
         sys.exit(1)
     
-    if not check_gh_cli_installed():
+    if not gh_check.result():
         print("❌ GitHub CLI is not installed.")
         print("💡 Install with: brew install gh")
         print("💡 Then login with: gh auth login")
         sys.exit(1)
     
-    # Check if user is logged into GitHub CLI
-    result = subprocess.run("gh auth status", shell=True, capture_output=True, text=True)
-    if result.returncode != 0:
+    if not auth_check.result():
         print("❌ Not logged into GitHub CLI")
         print("💡 Login with: gh auth login")
         sys.exit(1)
@@ -2,14 +2,13 @@
 
 from setuptools import setup, find_packages
 import os
+import re
 
 # Read version
 def get_version():
     with open(os.path.join(os.path.dirname(__file__), '__init__.py'), 'r') as f:
-        for line in f:
-            if line.startswith('__version__'):
-                return line.split('=')[1].strip().strip('"').strip("'")
-    return '1.0.0'
+        match = re.search(r'^__version__\s*=\s*[\'"]([^\'"]+)', f.read(), re.M)
+    return match.group(1) if match else '1.0.0'
 
 # Read requirements
 def get_requirements():
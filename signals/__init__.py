@@ -2,10 +2,10 @@
 
 from ignition import IgnitionEngine, IgnitionSignal
 from pressure import PressureEngine, PressureSignal, GammaWall
-from fuel import FuelEngine, FuelSignal, FundamentalData
+from fuel import FuelEngine, FuelSignal, FundamentalData, FuelFactorBits
 
 __all__ = [
     'IgnitionEngine', 'IgnitionSignal',
     'PressureEngine', 'PressureSignal', 'GammaWall', 
-    'FuelEngine', 'FuelSignal', 'FundamentalData'
+    'FuelEngine', 'FuelSignal', 'FundamentalData', 'FuelFactorBits'
 ]
\ No newline at end of file
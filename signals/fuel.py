@@ -1,13 +1,88 @@
 """Squeeze fuel detection engine - float, short interest, volume analysis"""
 
+import sys
 import numpy as np
-from typing import Dict, List, Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from enum import IntFlag
 
-from utils import MarketData, logger
+from utils import MarketData, logger, symbol_seed
 from config import config
 
-@dataclass
+# Squeeze score point tables: ascending bounds, points indexed by how many
+# bounds the value is past. Float rewards smaller values (< bound, so
+# bisect_right / side="right"); the others reward larger values (> bound,
+# bisect_left / side="left").
+_FLOAT_BOUNDS = (5_000_000, 10_000_000, 20_000_000)
+_FLOAT_POINTS = (30, 25, 15, 0)  # micro / small / medium float
+_SHORT_BOUNDS = (15, 20, 30)
+_SHORT_POINTS = (0, 10, 20, 25)  # moderate / high / very high short interest
+_BORROW_BOUNDS = (25, 50, 100)
+_BORROW_POINTS = (0, 5, 15, 20)  # moderately / expensive / very expensive to short
+_VOLUME_BOUNDS = (2, 3, 5)
+_VOLUME_POINTS = (0, 5, 10, 15)  # moderate / large / massive volume surge
+_INSIDER_BOUNDS = (30, 40)
+_INSIDER_POINTS = (0, 5, 10)  # insider ownership bonus (harder to borrow shares)
+
+# Synthetic fundamentals ranges: float shares (5M-50M), short interest (5-40%),
+# borrow rate (10-200% annual), avg volume factor (0.5-2x), insider ownership (5-50%)
+_SYNTH_LOW = (5_000_000, 5, 10, 0.5, 5)
+_SYNTH_HIGH = (50_000_000, 40, 200, 2.0, 50)
+
+# Element type of FundamentalsSoA columns - float32 halves the memory traffic
+# of analyze_batch. Every threshold is exact in float32, so only values within
+# float32 rounding of a threshold (a couple of shares above 2**24, ~1e-6 for
+# percentages) can bucket differently from analyze(); pass np.float64 to
+# from_records for exact parity
+SOA_DTYPE = np.float32
+
+class FuelFactorBits(IntFlag):
+    """Squeeze fuel factors, packed into FuelSignal.fuel_factors"""
+    MICRO_FLOAT = 1
+    SMALL_FLOAT = 2
+    LOW_FLOAT = 4
+    EXTREME_SI = 8
+    HIGH_SI = 16
+    ELEVATED_SI = 32
+    EXTREME_BORROW = 64
+    HIGH_BORROW = 128
+    VOLUME_SURGE = 256
+    HIGH_INSIDER = 512
+    SQUEEZE_SETUP = 1024
+    
+    @staticmethod
+    def decode(bits: int) -> List[str]:
+        """Factor labels for a bitmask, in bit order"""
+        return [label for flag, label in _FACTOR_LABELS if bits & flag]
+
+_FACTOR_LABELS = (
+    (FuelFactorBits.MICRO_FLOAT, "micro_float"),
+    (FuelFactorBits.SMALL_FLOAT, "small_float"),
+    (FuelFactorBits.LOW_FLOAT, "low_float"),
+    (FuelFactorBits.EXTREME_SI, "extreme_short_interest"),
+    (FuelFactorBits.HIGH_SI, "high_short_interest"),
+    (FuelFactorBits.ELEVATED_SI, "elevated_short_interest"),
+    (FuelFactorBits.EXTREME_BORROW, "extreme_borrow_cost"),
+    (FuelFactorBits.HIGH_BORROW, "high_borrow_cost"),
+    (FuelFactorBits.VOLUME_SURGE, "volume_surge"),
+    (FuelFactorBits.HIGH_INSIDER, "high_insider_ownership"),
+    (FuelFactorBits.SQUEEZE_SETUP, "squeeze_setup"),
+)
+
+@lru_cache(maxsize=8192)
+def _synthetic_fundamentals_core(symbol: str) -> Tuple[float, float, float, float, float]:
+    """Per-symbol part of the synthetic fundamentals - deterministic, so cached
+    
+    Returns (float shares, short %, borrow fee %, avg volume factor, insider %).
+    """
+    rng = np.random.default_rng(symbol_seed(symbol))
+    
+    # Generate realistic fundamental metrics in one draw
+    return tuple(rng.uniform(_SYNTH_LOW, _SYNTH_HIGH).tolist())
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class FundamentalData:
     symbol: str
     float_shares: int
@@ -19,6 +94,26 @@ class FundamentalData:
     insider_ownership: float
 
 @dataclass
+class FundamentalsSoA:
+    """Fundamentals for a batch of symbols as parallel arrays (one row per symbol)"""
+    float_shares: np.ndarray
+    short_percent: np.ndarray
+    borrow_fee: np.ndarray
+    avg_volume: np.ndarray
+    insider_ownership: np.ndarray
+    
+    @classmethod
+    def from_records(cls, records: List[FundamentalData], dtype=None) -> "FundamentalsSoA":
+        dtype = dtype or SOA_DTYPE
+        return cls(
+            float_shares=np.array([f.float_shares for f in records], dtype=dtype),
+            short_percent=np.array([f.short_percent for f in records], dtype=dtype),
+            borrow_fee=np.array([f.borrow_fee for f in records], dtype=dtype),
+            avg_volume=np.array([f.avg_volume for f in records], dtype=dtype),
+            insider_ownership=np.array([f.insider_ownership for f in records], dtype=dtype)
+        )
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class FuelSignal:
     low_float: bool
     high_short_interest: bool
@@ -26,7 +121,7 @@ class FuelSignal:
     volume_surge: bool
     relative_volume: float
     short_squeeze_score: float
-    fuel_factors: List[str]
+    fuel_factors: int  # FuelFactorBits mask
     score: float
 
 class FuelEngine:
@@ -60,7 +155,9 @@ class FuelEngine:
             
             # Identify fuel factors
             fuel_factors = self._identify_fuel_factors(
-                low_float, high_short_interest, high_borrow_cost, volume_surge, fundamental_data
+                low_float, high_short_interest, high_borrow_cost, volume_surge,
+                fundamental_data.float_shares, fundamental_data.short_percent,
+                fundamental_data.borrow_fee, fundamental_data.insider_ownership
             )
             
             # Calculate composite score
@@ -85,20 +182,93 @@ class FuelEngine:
             return FuelSignal(
                 low_float=False, high_short_interest=False, high_borrow_cost=False,
                 volume_surge=False, relative_volume=1.0, short_squeeze_score=0,
-                fuel_factors=[], score=0
+                fuel_factors=0, score=0
+            )
+    
+    def analyze_batch(self, market_data_list: List[MarketData],
+                      fundamentals: Optional[FundamentalsSoA] = None) -> List[FuelSignal]:
+        """Vectorised analyze() for many symbols at once
+        
+        Flags and scores are computed as array operations over the batch;
+        FuelSignal objects are only built at the end. fundamentals rows must
+        line up with market_data_list.
+        """
+        if not market_data_list:
+            return []
+        
+        if fundamentals is None:
+            fundamentals = FundamentalsSoA.from_records(
+                [self._generate_synthetic_fundamentals(md) for md in market_data_list]
             )
+        
+        float_shares = fundamentals.float_shares
+        short_percent = fundamentals.short_percent
+        borrow_fee = fundamentals.borrow_fee
+        avg_volume = fundamentals.avg_volume
+        insider_ownership = fundamentals.insider_ownership
+        # Batch arithmetic stays in the SoA dtype (Python float thresholds don't upcast)
+        volume = np.array([md.volume for md in market_data_list], dtype=float_shares.dtype)
+        
+        low_float = float_shares < config.MAX_FLOAT_SIZE
+        high_short_interest = short_percent > 15.0
+        high_borrow_cost = borrow_fee > 50.0  # 50% annual rate
+        relative_volume = np.divide(volume, avg_volume, out=np.ones_like(volume), where=avg_volume > 0)
+        volume_surge = relative_volume > config.MIN_VOLUME_MULTIPLE
+        
+        squeeze_scores = np.minimum(100.0, (
+            np.take(_FLOAT_POINTS, np.searchsorted(_FLOAT_BOUNDS, float_shares, side="right")) +
+            np.take(_SHORT_POINTS, np.searchsorted(_SHORT_BOUNDS, short_percent)) +
+            np.take(_BORROW_POINTS, np.searchsorted(_BORROW_BOUNDS, borrow_fee)) +
+            np.take(_VOLUME_POINTS, np.searchsorted(_VOLUME_BOUNDS, relative_volume)) +
+            np.take(_INSIDER_POINTS, np.searchsorted(_INSIDER_BOUNDS, insider_ownership))
+        ).astype(np.float64))
+        
+        scores = np.minimum(100, (
+            25.0 * low_float + 25.0 * high_short_interest + 20.0 * high_borrow_cost +
+            np.where(volume_surge, np.minimum(20, (relative_volume - 2) * 5), 0.0) +
+            np.minimum(10, squeeze_scores / 10)
+        ))
+        
+        factor_bits = (
+            np.where(low_float, np.select(
+                [float_shares < 5_000_000, float_shares < 10_000_000],
+                [FuelFactorBits.MICRO_FLOAT, FuelFactorBits.SMALL_FLOAT], FuelFactorBits.LOW_FLOAT), 0) |
+            np.where(high_short_interest, np.select(
+                [short_percent > 30, short_percent > 20],
+                [FuelFactorBits.EXTREME_SI, FuelFactorBits.HIGH_SI], FuelFactorBits.ELEVATED_SI), 0) |
+            np.where(high_borrow_cost, np.where(
+                borrow_fee > 100, FuelFactorBits.EXTREME_BORROW, FuelFactorBits.HIGH_BORROW), 0) |
+            np.where(volume_surge, FuelFactorBits.VOLUME_SURGE, 0) |
+            np.where(insider_ownership > 40, FuelFactorBits.HIGH_INSIDER, 0) |
+            np.where((float_shares < 5_000_000) & (short_percent > 25), FuelFactorBits.SQUEEZE_SETUP, 0)
+        )
+        
+        signals = []
+        columns = zip(low_float.tolist(), high_short_interest.tolist(), high_borrow_cost.tolist(),
+                      volume_surge.tolist(), relative_volume.tolist(), squeeze_scores.tolist(), scores.tolist(),
+                      factor_bits.tolist())
+        for low, high_si, high_borrow, surge, rel_vol, squeeze, score, bits in columns:
+            signals.append(FuelSignal(
+                low_float=low,
+                high_short_interest=high_si,
+                high_borrow_cost=high_borrow,
+                volume_surge=surge,
+                relative_volume=rel_vol,
+                short_squeeze_score=squeeze,
+                fuel_factors=bits,
+                score=score
+            ))
+        
+        return signals
     
     def _generate_synthetic_fundamentals(self, market_data: MarketData) -> FundamentalData:
         """Generate synthetic fundamental data for demonstration"""
-        np.random.seed(hash(market_data.symbol) % 2**32)
+        base_float, short_percent, borrow_fee, volume_factor, insider_ownership = \
+            _synthetic_fundamentals_core(market_data.symbol)
         
-        # Generate realistic fundamental metrics
-        base_float = np.random.uniform(5_000_000, 50_000_000)  # 5M-50M shares
-        short_percent = np.random.uniform(5, 40)  # 5-40% short interest
-        borrow_fee = np.random.uniform(10, 200)  # 10-200% annual borrow rate
-        avg_volume = market_data.volume * np.random.uniform(0.5, 2.0)  # Random baseline volume
+        # Overlay live price/volume
+        avg_volume = market_data.volume * volume_factor  # Random baseline volume
         market_cap = market_data.price * base_float
-        insider_ownership = np.random.uniform(5, 50)  # 5-50% insider ownership
         
         return FundamentalData(
             symbol=market_data.symbol,
@@ -113,87 +283,56 @@ class FuelEngine:
     
     def _calculate_squeeze_score(self, fundamental_data: FundamentalData, relative_volume: float) -> float:
         """Calculate proprietary short squeeze potential score"""
-        score = 0.0
-        
-        # Float factor (smaller = better)
-        if fundamental_data.float_shares < 5_000_000:
-            score += 30  # Micro float
-        elif fundamental_data.float_shares < 10_000_000:
-            score += 25  # Small float
-        elif fundamental_data.float_shares < 20_000_000:
-            score += 15  # Medium float
-        
-        # Short interest factor
-        if fundamental_data.short_percent > 30:
-            score += 25  # Very high short interest
-        elif fundamental_data.short_percent > 20:
-            score += 20  # High short interest
-        elif fundamental_data.short_percent > 15:
-            score += 10  # Moderate short interest
-        
-        # Borrow cost factor
-        if fundamental_data.borrow_fee > 100:
-            score += 20  # Very expensive to short
-        elif fundamental_data.borrow_fee > 50:
-            score += 15  # Expensive to short
-        elif fundamental_data.borrow_fee > 25:
-            score += 5   # Moderately expensive
-        
-        # Volume factor
-        if relative_volume > 5:
-            score += 15  # Massive volume surge
-        elif relative_volume > 3:
-            score += 10  # Large volume surge
-        elif relative_volume > 2:
-            score += 5   # Moderate volume surge
-        
-        # Insider ownership bonus (harder to borrow shares)
-        if fundamental_data.insider_ownership > 40:
-            score += 10
-        elif fundamental_data.insider_ownership > 30:
-            score += 5
+        score = (
+            _FLOAT_POINTS[bisect_right(_FLOAT_BOUNDS, fundamental_data.float_shares)] +
+            _SHORT_POINTS[bisect_left(_SHORT_BOUNDS, fundamental_data.short_percent)] +
+            _BORROW_POINTS[bisect_left(_BORROW_BOUNDS, fundamental_data.borrow_fee)] +
+            _VOLUME_POINTS[bisect_left(_VOLUME_BOUNDS, relative_volume)] +
+            _INSIDER_POINTS[bisect_left(_INSIDER_BOUNDS, fundamental_data.insider_ownership)]
+        )
         
-        return min(100, score)
+        return min(100.0, float(score))
     
     def _identify_fuel_factors(self, low_float: bool, high_short_interest: bool, 
                              high_borrow_cost: bool, volume_surge: bool, 
-                             fundamental_data: FundamentalData) -> List[str]:
-        """Identify and label squeeze fuel factors"""
-        factors = []
+                             float_shares: float, short_percent: float,
+                             borrow_fee: float, insider_ownership: float) -> int:
+        """Identify squeeze fuel factors as a FuelFactorBits mask"""
+        bits = 0
         
         if low_float:
-            if fundamental_data.float_shares < 5_000_000:
-                factors.append("micro_float")
-            elif fundamental_data.float_shares < 10_000_000:
-                factors.append("small_float")
+            if float_shares < 5_000_000:
+                bits |= FuelFactorBits.MICRO_FLOAT
+            elif float_shares < 10_000_000:
+                bits |= FuelFactorBits.SMALL_FLOAT
             else:
-                factors.append("low_float")
+                bits |= FuelFactorBits.LOW_FLOAT
         
         if high_short_interest:
-            if fundamental_data.short_percent > 30:
-                factors.append("extreme_short_interest")
-            elif fundamental_data.short_percent > 20:
-                factors.append("high_short_interest")
+            if short_percent > 30:
+                bits |= FuelFactorBits.EXTREME_SI
+            elif short_percent > 20:
+                bits |= FuelFactorBits.HIGH_SI
             else:
-                factors.append("elevated_short_interest")
+                bits |= FuelFactorBits.ELEVATED_SI
         
         if high_borrow_cost:
-            if fundamental_data.borrow_fee > 100:
-                factors.append("extreme_borrow_cost")
+            if borrow_fee > 100:
+                bits |= FuelFactorBits.EXTREME_BORROW
             else:
-                factors.append("high_borrow_cost")
+                bits |= FuelFactorBits.HIGH_BORROW
         
         if volume_surge:
-            factors.append("volume_surge")
+            bits |= FuelFactorBits.VOLUME_SURGE
         
         # Additional factors
-        if fundamental_data.insider_ownership > 40:
-            factors.append("high_insider_ownership")
+        if insider_ownership > 40:
+            bits |= FuelFactorBits.HIGH_INSIDER
         
-        if fundamental_data.float_shares < 5_000_000 and fundamental_data.short_percent > 25:
-            factors.append("squeeze_setup")
+        if float_shares < 5_000_000 and short_percent > 25:
+            bits |= FuelFactorBits.SQUEEZE_SETUP
         
-        return factors
+        return int(bits)
     
     def _calculate_fuel_score(self, low_float: bool, high_short_interest: bool,
                             high_borrow_cost: bool, volume_surge: bool,
@@ -243,7 +382,7 @@ class FuelEngine:
             reasons.append(f"Strong squeeze setup (score: {signal.short_squeeze_score:.0f})")
         
         if signal.fuel_factors:
-            factor_str = ", ".join(signal.fuel_factors)
+            factor_str = ", ".join(FuelFactorBits.decode(signal.fuel_factors))
             reasons.append(f"Fuel factors: {factor_str}")
         
         if not reasons:
@@ -1,14 +1,86 @@
 """Ignition timing signal engine - VWAP momentum and band analysis"""
 
+import sys
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
-from utils import MarketData, calculate_ema, calculate_bollinger_bands, logger
+from utils import MarketData, calculate_ema, logger, symbol_seed
 from config import config
 
-@dataclass
+# Max cached synthetic ignition contexts before the cache is reset
+CONTEXT_CACHE_SIZE = 4096
+
+try:
+    from numba import njit
+except ImportError:  # numpy kernel below
+    njit = None
+
+@lru_cache(maxsize=4096)
+def _synthetic_returns(symbol: str, periods: int) -> np.ndarray:
+    """Deterministic per-symbol synthetic returns (read-only, cached)"""
+    rng = np.random.default_rng(symbol_seed(symbol))  # Deterministic randomness
+    returns = rng.normal(0, 0.02, periods)  # 2% daily volatility
+    returns.setflags(write=False)
+    return returns
+
+def _synthetic_prices(symbol: str, price: float, periods: int) -> np.ndarray:
+    """Synthetic price history for symbol ending at price"""
+    # Create realistic price movement around current price
+    base_price = price * 0.95  # Start slightly below current
+    returns = _synthetic_returns(symbol, periods)
+    prices = np.empty(periods)
+    prices[0] = base_price
+    prices[1:] = base_price * np.cumprod(1.0 + returns[1:])
+    
+    # Ensure current price is the last price
+    prices[-1] = price
+    
+    return prices
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean, NaN until the first full window (like pandas rolling().mean())"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        cs = np.cumsum(np.insert(values, 0, 0.0))
+        out[window - 1:] = (cs[window:] - cs[:-window]) / window
+    return out
+
+def _bollinger_width(prices: np.ndarray, period: int = 20, std_dev: float = 2.0) -> np.ndarray:
+    """Upper minus lower Bollinger band (sample std, as utils.calculate_bollinger_bands)"""
+    width = np.full(len(prices), np.nan)
+    if len(prices) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, period)
+        width[period - 1:] = 2 * std_dev * windows.std(axis=1, ddof=1)
+    return width
+
+def _slope_last_n(y: np.ndarray, n: int) -> float:
+    """Least-squares slope of the last n values against x = 0..n-1 (closed form)"""
+    tail = y[-n:]
+    x = np.arange(n, dtype=np.float64)
+    x_dev = x - x.mean()
+    return float(np.dot(x_dev, tail - tail.mean()) / np.dot(x_dev, x_dev))
+
+if njit is not None:
+    @njit(cache=True)
+    def _slope_last_n(y, n):
+        """Compiled single-pass version of the numpy kernel above"""
+        start = len(y) - n
+        sum_x = 0.0
+        sum_y = 0.0
+        sum_xy = 0.0
+        sum_x2 = 0.0
+        for i in range(n):
+            v = y[start + i]
+            sum_x += i
+            sum_y += v
+            sum_xy += i * v
+            sum_x2 += i * i
+        return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class IgnitionSignal:
     vwap_momentum: bool
     expansion_energy: bool  
@@ -22,24 +94,19 @@ class IgnitionEngine:
     """Detects VWAP momentum and band expansion signals"""
     
     def __init__(self):
-        self.historical_data = {}  # Cache for historical calculations
+        self.historical_data = {}  # Cache for historical calculations: (symbol, periods) -> context
     
-    def analyze(self, market_data: MarketData, historical_prices: Optional[pd.Series] = None) -> IgnitionSignal:
+    def analyze(self, market_data: MarketData,
+                historical_prices: Optional[Union[pd.Series, np.ndarray]] = None) -> IgnitionSignal:
         """Analyze ignition timing signals for a symbol"""
         try:
-            # If no historical data provided, create synthetic data for demo
+            # If no historical data provided, use synthetic data for demo
             if historical_prices is None:
-                historical_prices = self._generate_synthetic_history(market_data)
-            
-            # Calculate VWAP spread slope
-            vwap_spread = self._calculate_vwap_spread(historical_prices, market_data.vwap)
-            vwap_slope = self._calculate_slope(vwap_spread)
-            
-            # Calculate band expansion
-            upper_band, sma, lower_band = calculate_bollinger_bands(historical_prices)
-            current_expansion = upper_band.iloc[-1] - lower_band.iloc[-1]
-            historical_avg_expansion = (upper_band - lower_band).rolling(20).mean().iloc[-1]
-            expansion_ratio = current_expansion / historical_avg_expansion if historical_avg_expansion > 0 else 1.0
+                vwap_slope, expansion_ratio = self._synthetic_context(market_data.symbol)
+            else:
+                vwap_slope, expansion_ratio = self._price_context(
+                    np.asarray(historical_prices, dtype=np.float64), market_data.vwap
+                )
             
             # Calculate distance from extremes
             distance_from_extremes = min(
@@ -76,43 +143,100 @@ class IgnitionEngine:
                 score=0
             )
     
-    def _calculate_vwap_spread(self, prices: pd.Series, current_vwap: float) -> pd.Series:
+    def analyze_batch(self, market_data_list: List[MarketData]) -> List[IgnitionSignal]:
+        """Vectorised analyze() over synthetic histories for many symbols
+        
+        The per-symbol contexts come from the _synthetic_context cache; the
+        distance, flag and score arithmetic runs once over the whole batch.
+        """
+        if not market_data_list:
+            return []
+        
+        contexts = np.array([self._synthetic_context(md.symbol) for md in market_data_list], dtype=np.float64)
+        vwap_slope, expansion_ratio = contexts[:, 0], contexts[:, 1]
+        price = np.array([md.price for md in market_data_list], dtype=np.float64)
+        high = np.array([md.high for md in market_data_list], dtype=np.float64)
+        low = np.array([md.low for md in market_data_list], dtype=np.float64)
+        
+        distance_from_extremes = np.minimum(np.abs(price - high) / price, np.abs(price - low) / price)
+        
+        vwap_momentum = vwap_slope > 0.001
+        expansion_energy = expansion_ratio > 1.5
+        entry_timing = distance_from_extremes < config.MAX_DISTANCE_FROM_HOD_LOD
+        
+        # Same components as _calculate_ignition_score
+        max_distance = config.MAX_DISTANCE_FROM_HOD_LOD
+        scores = np.minimum(100, (
+            np.where(vwap_momentum, np.minimum(40, np.abs(vwap_slope) * 10000), 0.0) +
+            np.where(expansion_energy, np.minimum(35, (expansion_ratio - 1) * 35), 0.0) +
+            np.where(entry_timing, (max_distance - distance_from_extremes) / max_distance * 25, 0.0)
+        ))
+        
+        columns = zip(vwap_momentum.tolist(), expansion_energy.tolist(), entry_timing.tolist(),
+                      vwap_slope.tolist(), expansion_ratio.tolist(), distance_from_extremes.tolist(),
+                      scores.tolist())
+        return [
+            IgnitionSignal(
+                vwap_momentum=momentum,
+                expansion_energy=expansion,
+                entry_timing=timing,
+                vwap_spread_slope=slope,
+                band_expansion_ratio=ratio,
+                distance_from_extremes=distance,
+                score=score
+            )
+            for momentum, expansion, timing, slope, ratio, distance, score in columns
+        ]
+    
+    def _price_context(self, prices: np.ndarray, current_vwap: float) -> Tuple[float, float]:
+        """(VWAP spread slope, band expansion ratio) for a price history"""
+        # Calculate VWAP spread slope
+        vwap_spread = self._calculate_vwap_spread(prices, current_vwap)
+        vwap_slope = self._calculate_slope(vwap_spread)
+        
+        # Calculate band expansion
+        width = _bollinger_width(prices)
+        current_expansion = width[-1]
+        historical_avg_expansion = width[-20:].mean()  # last value of the 20-period rolling mean
+        expansion_ratio = current_expansion / historical_avg_expansion if historical_avg_expansion > 0 else 1.0
+        
+        return vwap_slope, float(expansion_ratio)
+    
+    def _synthetic_context(self, symbol: str, periods: int = 100) -> Tuple[float, float]:
+        """_price_context of the synthetic history, cached per symbol
+        
+        The synthetic history is a fixed per-symbol path scaled by the live
+        price, and both the spread slope and the expansion ratio are
+        unchanged by that scaling, so they are computed once on a unit-price
+        path. (The VWAP argument is not used by the synthetic spread.)
+        """
+        key = (symbol, periods)
+        context = self.historical_data.get(key)
+        if context is None:
+            if len(self.historical_data) >= CONTEXT_CACHE_SIZE:
+                self.historical_data.clear()
+            context = self._price_context(_synthetic_prices(symbol, 1.0, periods), 1.0)
+            self.historical_data[key] = context
+        return context
+    
+    def _calculate_vwap_spread(self, prices: np.ndarray, current_vwap: float) -> np.ndarray:
         """Calculate spread between price and VWAP over time"""
         # For demonstration, create a spread series
         # In production, this would use real VWAP data
-        synthetic_vwap = prices.rolling(20).mean()  # Approximate VWAP with SMA
+        synthetic_vwap = _rolling_mean(prices, 20)  # Approximate VWAP with SMA
         return (prices - synthetic_vwap) / synthetic_vwap
     
-    def _calculate_slope(self, series: pd.Series, periods: int = 10) -> float:
+    def _calculate_slope(self, series: np.ndarray, periods: int = 10) -> float:
         """Calculate slope of recent price movement"""
         if len(series) < periods:
             return 0.0
         
-        recent_data = series.tail(periods)
-        x = np.arange(len(recent_data))
-        y = recent_data.values
-        
-        # Linear regression slope
-        slope = np.polyfit(x, y, 1)[0]
-        return slope
+        # Linear regression slope over the last `periods` values
+        return float(_slope_last_n(series, periods))
     
-    def _generate_synthetic_history(self, market_data: MarketData, periods: int = 100) -> pd.Series:
+    def _generate_synthetic_history(self, market_data: MarketData, periods: int = 100) -> np.ndarray:
         """Generate synthetic historical data for demonstration"""
-        # Create realistic price movement around current price
-        np.random.seed(hash(market_data.symbol) % 2**32)  # Deterministic randomness
-        
-        base_price = market_data.price * 0.95  # Start slightly below current
-        returns = np.random.normal(0, 0.02, periods)  # 2% daily volatility
-        prices = [base_price]
-        
-        for ret in returns[1:]:
-            new_price = prices[-1] * (1 + ret)
-            prices.append(new_price)
-        
-        # Ensure current price is the last price
-        prices[-1] = market_data.price
-        
-        return pd.Series(prices)
+        return _synthetic_prices(market_data.symbol, market_data.price, periods)
     
     def _calculate_ignition_score(self, vwap_slope: float, expansion_ratio: float, 
                                 distance_from_extremes: float, vwap_momentum: bool,
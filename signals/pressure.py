@@ -5,7 +5,7 @@ from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from scipy.stats import norm
 
-from utils import MarketData, OptionsData, logger
+from utils import MarketData, OptionsData, logger, symbol_seed
 from config import config
 
 @dataclass
@@ -100,7 +100,8 @@ class PressureEngine:
         puts_oi = {}
         iv = {}
         
-        np.random.seed(hash(market_data.symbol) % 2**32)
+        # Per-call generator: this runs on the scoring thread pool
+        rng = np.random.default_rng(symbol_seed(market_data.symbol))
         
         for strike in strikes:
             # Higher volume/OI near the money
@@ -108,14 +109,14 @@ class PressureEngine:
             base_volume = max(10, int(1000 * np.exp(-distance * 10)))
             base_oi = max(50, int(5000 * np.exp(-distance * 8)))
             
-            calls_volume[strike] = int(base_volume * np.random.uniform(0.5, 2.0))
-            puts_volume[strike] = int(base_volume * np.random.uniform(0.5, 2.0))
-            calls_oi[strike] = int(base_oi * np.random.uniform(0.5, 2.0))
-            puts_oi[strike] = int(base_oi * np.random.uniform(0.5, 2.0))
+            calls_volume[strike] = int(base_volume * rng.uniform(0.5, 2.0))
+            puts_volume[strike] = int(base_volume * rng.uniform(0.5, 2.0))
+            calls_oi[strike] = int(base_oi * rng.uniform(0.5, 2.0))
+            puts_oi[strike] = int(base_oi * rng.uniform(0.5, 2.0))
             
             # IV smile
             base_iv = 0.3 + (distance * 2)  # Higher IV for OTM options
-            iv[strike] = max(0.1, base_iv + np.random.uniform(-0.1, 0.1))
+            iv[strike] = max(0.1, base_iv + rng.uniform(-0.1, 0.1))
         
         return OptionsData(
             symbol=market_data.symbol,
@@ -0,0 +1,9 @@
+"""Put the repo root and package dirs on sys.path (modules use flat imports)"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+for path in (ROOT, ROOT / "execution", ROOT / "signals", ROOT / "scoring"):
+    sys.path.insert(0, str(path))
@@ -0,0 +1,86 @@
+"""BrokerManager / AlpacaBroker against a local stand-in for the Alpaca API"""
+
+import asyncio
+
+from aiohttp import web
+
+from brokers import AlpacaBroker, BrokerManager, Order, OrderSide, OrderStatus, OrderType
+
+async def _account(request):
+    return web.json_response({"buying_power": "1000", "equity": "1500"})
+
+async def _orders(request):
+    body = await request.json()
+    return web.json_response({
+        "id": "order-1",
+        "status": "accepted",
+        "symbol": body["symbol"],
+        "side": body["side"],
+        "qty": body["qty"],
+        "filled_qty": "0"
+    }, status=201)
+
+async def _place_order_without_start():
+    app = web.Application()
+    app.router.add_get("/v2/account", _account)
+    app.router.add_post("/v2/orders", _orders)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    broker = AlpacaBroker("key", "secret")
+    broker.base_url = f"http://127.0.0.1:{port}"
+    manager = BrokerManager()
+    manager.add_broker("alpaca_paper", broker)
+    manager.set_default_broker("alpaca_paper")
+    
+    try:
+        # No manager.start() - the session is opened on the first request
+        response = await manager.place_order(Order("AAPL", OrderSide.BUY, 2, OrderType.MARKET))
+        account = await manager.get_account()
+    finally:
+        await manager.close()
+        await runner.cleanup()
+    
+    return response, account
+
+def test_place_order_opens_session_lazily():
+    response, account = asyncio.run(_place_order_without_start())
+    
+    assert response.status == OrderStatus.PENDING
+    assert response.order_id == "order-1"
+    assert response.quantity == 2.0
+    assert account.buying_power == 1000.0
+
+async def _positions(request):
+    return web.json_response([
+        {"symbol": "AAPL251219C00150000", "qty": "3", "avg_cost": "2.5",
+         "market_value": "900", "unrealized_pl": "150"},
+        {"symbol": "AAPL251219P00150000", "qty": "1", "avg_cost": "1.25",
+         "market_value": "100", "unrealized_pl": "-25"}
+    ])
+
+async def _fetch_positions():
+    app = web.Application()
+    app.router.add_get("/v2/positions", _positions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    
+    broker = AlpacaBroker("key", "secret")
+    broker.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    try:
+        return await broker.get_positions()
+    finally:
+        await broker.close()
+        await runner.cleanup()
+
+def test_positions_keep_full_option_symbols():
+    positions = asyncio.run(_fetch_positions())
+    
+    assert [p.symbol for p in positions] == ["AAPL251219C00150000", "AAPL251219P00150000"]
+    assert positions[0].quantity == 3.0
+    assert positions[1].unrealized_pnl == -25.0
@@ -0,0 +1,53 @@
+"""FuelEngine.analyze_batch (float32 SoA) against per-symbol analyze()"""
+
+from datetime import datetime
+
+import numpy as np
+
+import fuel
+from config import config
+from fuel import FuelEngine, FundamentalData, FundamentalsSoA
+from utils import MarketData
+
+THRESHOLDS = (
+    fuel._FLOAT_BOUNDS + fuel._SHORT_BOUNDS + fuel._BORROW_BOUNDS + fuel._VOLUME_BOUNDS + fuel._INSIDER_BOUNDS +
+    (config.MAX_FLOAT_SIZE, config.MIN_VOLUME_MULTIPLE, 15.0, 50.0, 100.0, 25.0, 40.0)
+)
+
+def test_thresholds_exact_in_soa_dtype():
+    for bound in THRESHOLDS:
+        assert float(fuel.SOA_DTYPE(bound)) == bound
+
+def _edge_cases():
+    """Fundamentals sitting on, and one step either side of, each threshold"""
+    avg_volume = 1_000_000
+    cases = []
+    for floats in (4_999_999, 5_000_000, 5_000_001, 9_999_999, 10_000_000, 10_000_001,
+                   19_999_998, 20_000_000, 20_000_002, 30_000_000):
+        for pct in (14.99, 15.0, 15.01, 20.0, 20.01, 25.0, 25.01, 30.0, 30.01, 40.0, 40.01):
+            for ratio in (1.99, 2.0, 2.01, 3.0, 3.01, 5.0, 5.01):
+                cases.append((
+                    FundamentalData(
+                        symbol="EDGE", float_shares=floats, short_percent=pct, short_shares=0,
+                        borrow_fee=pct * 2.5, avg_volume=avg_volume, market_cap=0.0,
+                        insider_ownership=pct
+                    ),
+                    MarketData("EDGE", 10.0, int(avg_volume * ratio), 10.0, 10.5, 9.5, 10.0, datetime.now())
+                ))
+    return cases
+
+def test_batch_buckets_match_analyze_at_thresholds():
+    engine = FuelEngine()
+    fundamentals, market_data = zip(*_edge_cases())
+    
+    soa = FundamentalsSoA.from_records(list(fundamentals))
+    assert soa.short_percent.dtype == np.float32
+    batch = engine.analyze_batch(list(market_data), soa)
+    
+    for md, fd, signal in zip(market_data, fundamentals, batch):
+        expected = engine.analyze(md, fd)
+        assert signal.fuel_factors == expected.fuel_factors
+        assert signal.short_squeeze_score == expected.short_squeeze_score
+        assert (signal.low_float, signal.high_short_interest, signal.high_borrow_cost, signal.volume_surge) == \
+            (expected.low_float, expected.high_short_interest, expected.high_borrow_cost, expected.volume_surge)
+        assert np.isclose(signal.score, expected.score, rtol=1e-5)
@@ -0,0 +1,34 @@
+"""JSON export of scan results"""
+
+import json
+import math
+
+from output import OutputFormatter
+from utils import ScanResult
+
+def _result(**overrides) -> ScanResult:
+    fields = dict(
+        symbol="ABC", rank=1, score=82.5, current_price=10.0, vwap=9.9,
+        target_strike=11.0, probability_reach=0.75, expected_return=0.1,
+        timeframe="1-2 hours", entry_low=9.95, entry_high=10.05, stop_loss=9.5,
+        squeeze_factors=["volume_surge"], reasoning='Says "go"'
+    )
+    fields.update(overrides)
+    return ScanResult(**fields)
+
+def test_json_round_trips():
+    doc = json.loads(OutputFormatter().format_json([_result()], {"timeframe": "1h"}))
+    
+    candidate = doc["candidates"][0]
+    assert doc["total_candidates"] == 1
+    assert candidate == {**_result().api_dict, "entry_zone": {"low": 9.95, "high": 10.05}}
+
+def test_non_finite_numbers_become_null():
+    result = _result(expected_return=math.nan, target_strike=math.inf, probability_reach=-math.inf)
+    
+    candidate = json.loads(OutputFormatter().format_json([result]))["candidates"][0]
+    
+    assert candidate["expected_return"] is None
+    assert candidate["target_strike"] is None
+    assert candidate["probability_reach"] is None
+    assert candidate["score"] == 82.5
@@ -1,11 +1,17 @@
 """Utility functions for the market scanner"""
 
+import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 @dataclass
 class MarketData:
@@ -40,21 +46,85 @@ class ScanResult:
     probability_reach: float
     expected_return: float
     timeframe: str
-    entry_zone: Tuple[float, float]
+    entry_low: float
+    entry_high: float
     stop_loss: float
     squeeze_factors: List[str]
     reasoning: str
+    
+    @property
+    def entry_zone(self) -> Tuple[float, float]:
+        """(entry_low, entry_high) - kept for existing callers"""
+        return self.entry_low, self.entry_high
+    
+    @cached_property
+    def api_dict(self) -> Dict:
+        """Rounded API/JSON representation, computed once per result"""
+        return {
+            "rank": self.rank,
+            "symbol": self.symbol,
+            "score": round(self.score, 1),
+            "current_price": round(self.current_price, 2),
+            "vwap": round(self.vwap, 2),
+            "target_strike": round(self.target_strike, 2) if self.target_strike else None,
+            "probability_reach": round(self.probability_reach, 3),
+            "expected_return": round(self.expected_return, 3),
+            "timeframe": self.timeframe,
+            "entry_zone": {
+                "low": round(self.entry_low, 2),
+                "high": round(self.entry_high, 2)
+            },
+            "stop_loss": round(self.stop_loss, 2),
+            "squeeze_factors": self.squeeze_factors,
+            "reasoning": self.reasoning
+        }
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_log_file: Optional[str] = None
+
+def _stop_log_listener():
+    """Flush and detach the queued handlers installed by setup_logging"""
+    global _log_listener, _log_queue_handler, _log_file
+    
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    logging.getLogger().removeHandler(_log_queue_handler)
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = _log_queue_handler = _log_file = None
+
+atexit.register(_stop_log_listener)
 
 def setup_logging(log_level: str = "INFO", log_file: str = "market_scanner.log"):
-    """Setup logging configuration"""
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    """Setup logging configuration
+    
+    Records go through a QueueHandler; file and console writes happen on a
+    QueueListener thread. Repeated calls update the level, and rebuild the
+    handlers when log_file changes.
+    """
+    global _log_listener, _log_queue_handler, _log_file
+    
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level))
+    
+    if _log_listener is not None and log_file != _log_file:
+        _stop_log_listener()
+    
+    if _log_listener is None:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root.addHandler(_log_queue_handler)
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        _log_file = log_file
+    
     return logging.getLogger(__name__)
 
 def calculate_ema(prices: pd.Series, period: int) -> pd.Series:
@@ -81,6 +151,11 @@ def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     rs = gain / loss
     return 100 - (100 / (1 + rs))
 
+@lru_cache(maxsize=16384)
+def symbol_seed(symbol: str) -> int:
+    """Deterministic 32-bit RNG seed for a symbol's synthetic data"""
+    return hash(symbol) & 0xFFFFFFFF
+
 def is_market_hours() -> bool:
     """Check if market is currently open (9:30 AM - 4:00 PM ET)"""
     now = datetime.now()
@@ -114,4 +189,27 @@ def estimate_timeframe(probability: float, volatility: float) -> str:
     else:
         return "4+ hours"
 
-logger = setup_logging()
\ No newline at end of file
+class TokenBucket:
+    """Async token bucket - acquire() waits until a token is available"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, sleeping until the bucket refills if empty"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# Handlers are installed by setup_logging(), not on import
+logger = logging.getLogger(__name__)
@@ -1,8 +1,18 @@
 
 #include <stdio.h>
-#include <stdlib.h>
 #include <unistd.h>
 
 int main(int argc, char *argv[]) {
-    return system("/usr/bin/python3 market-scanner-macos");
+    /* Replace this process with python3 - no intermediate /bin/sh */
+    char *args[argc + 2];
+    args[0] = "python3";
+    args[1] = "market-scanner-macos.pyz";
+    for (int i = 1; i < argc; i++) {
+        args[i + 1] = argv[i];
+    }
+    args[argc + 1] = NULL;
+
+    execv("/usr/bin/python3", args);
+    perror("execv");
+    return 127;
 }